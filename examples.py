@@ -3,15 +3,23 @@ Examples demonstrating how to use the univllm package.
 """
 
 import asyncio
-import os
+import sys
+import time
 from univllm import UniversalLLMClient
 from univllm.models import ProviderType
 
 
-async def basic_completion_example():
-    """Basic completion example with auto-detection."""
-    client = UniversalLLMClient()
+async def _bounded(semaphore: asyncio.Semaphore, coro):
+    """Await a coroutine while holding a slot of the semaphore."""
+    async with semaphore:
+        return await coro
 
+
+async def basic_completion_example(client: UniversalLLMClient):
+    """Basic completion example with auto-detection.
+
+    The client passed in is created in ``main()`` with explicit ``http_limits``.
+    """
     # The client will auto-detect the provider based on the model name
     response = await client.complete(
         messages=["What is the capital of France?"],
@@ -23,19 +31,16 @@ async def basic_completion_example():
     print(f"Model: {response.model}")
 
 
-async def explicit_provider_example():
+async def explicit_provider_example(client: UniversalLLMClient):
     """Example with explicit provider selection."""
-    # Initialize with specific provider
-    client = UniversalLLMClient(
-        provider=ProviderType.ANTHROPIC, api_key=os.getenv("ANTHROPIC_API_KEY")
-    )
-
+    # Select the provider explicitly instead of relying on auto-detection
     response = await client.complete(
         messages=[
             {"role": "system", "content": "You are a helpful assistant."},
             {"role": "user", "content": "Explain quantum computing briefly."},
         ],
         model="claude-3-sonnet-20240229",
+        provider=ProviderType.ANTHROPIC,
         max_tokens=150,
         temperature=0.7,
     )
@@ -43,26 +48,45 @@ async def explicit_provider_example():
     print(f"Response: {response.content}")
 
 
-async def streaming_example():
-    """Example of streaming completion."""
-    client = UniversalLLMClient()
+async def streaming_example(client: UniversalLLMClient) -> str:
+    """Example of streaming completion.
 
+    Returns the full response text once the stream is finished.
+    """
     print("Streaming response:")
+    # Keep the full response as a list of chunks and join once at the end.
+    # Do not do `text += chunk`: each concatenation copies the whole string
+    # (O(N^2) overall) and the growing string is held across every await.
+    parts: list = []
+    # Flushing stdout on every token costs a write() syscall per chunk, so
+    # buffer chunks and flush every ~50 ms or 8 chunks instead
+    buffer = []
+    last_flush = time.monotonic()
     async for chunk in client.stream_complete(
         messages=["Tell me a short story about a robot."],
         model="gpt-3.5-turbo",
         max_tokens=200,
     ):
-        print(chunk, end="", flush=True)
+        parts.append(chunk)
+        buffer.append(chunk)
+        now = time.monotonic()
+        if now - last_flush > 0.05 or len(buffer) > 8:
+            sys.stdout.write("".join(buffer))
+            sys.stdout.flush()
+            buffer.clear()
+            last_flush = now
+    sys.stdout.write("".join(buffer))
     print()  # New line after streaming
 
+    return "".join(parts)
+
 
-async def multi_provider_example():
-    """Example using multiple providers."""
-    client = UniversalLLMClient()
+async def multi_provider_example(client: UniversalLLMClient, all_models: dict):
+    """Example using multiple providers.
 
-    # Get supported models for all providers
-    all_models = client.get_supported_models()
+    ``all_models`` is the result of ``client.get_supported_models()``, fetched
+    once in ``main()``.
+    """
     print("Supported models by provider:")
     for provider, models in all_models.items():
         print(f"{provider}: {models[:3]}...")  # Show first 3 models
@@ -70,24 +94,60 @@ async def multi_provider_example():
     # Compare responses from different providers
     question = "What is machine learning?"
 
+    # Send the requests at once so the round-trips overlap. The semaphore caps
+    # how many are in flight when this is scaled up to more providers/prompts;
+    # keep it within the pool's max_keepalive_connections and provider rate
+    # limits, otherwise requests pile up behind the pool or come back as 429s.
+    semaphore = asyncio.Semaphore(8)
+    tasks = [
+        _bounded(semaphore, client.complete(messages=[question], model=model))
+        for model in ("gpt-3.5-turbo", "claude-3-haiku-20240307")
+    ]
+    openai_response, anthropic_response = await asyncio.gather(
+        *tasks, return_exceptions=True
+    )
+
     # OpenAI
-    openai_response = await client.complete(messages=[question], model="gpt-3.5-turbo")
+    if isinstance(openai_response, Exception):
+        raise openai_response
     print(f"OpenAI: {openai_response.content[:100]}...")
 
     # Anthropic (if API key is available)
-    try:
-        anthropic_response = await client.complete(
-            messages=[question], model="claude-3-haiku-20240307"
-        )
+    if isinstance(anthropic_response, Exception):
+        print(f"Anthropic not available: {anthropic_response}")
+    else:
         print(f"Anthropic: {anthropic_response.content[:100]}...")
-    except Exception as e:
-        print(f"Anthropic not available: {e}")
 
 
-async def model_capabilities_example():
-    """Example of checking model capabilities."""
-    client = UniversalLLMClient()
+async def batch_completion_example(
+    client: UniversalLLMClient, prompts: list, model: str, concurrency: int = 16
+) -> list:
+    """Example of fanning out many prompts with bounded concurrency.
+
+    Keep ``concurrency`` within the client's ``http_limits`` pool size (see
+    ``main()``), which is the lever to tune for large batches.
+    """
+    # Cap the number of in-flight requests so large batches don't trip
+    # provider rate limits or exhaust the connection pool
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Awaiting each prompt in turn would cost N round-trips; gather overlaps
+    # them while preserving the order of the results
+    responses = await asyncio.gather(
+        *(
+            _bounded(semaphore, client.complete(messages=[p], model=model))
+            for p in prompts
+        )
+    )
 
+    for prompt, response in zip(prompts, responses):
+        print(f"{prompt} -> {response.content[:60]}...")
+
+    return responses
+
+
+async def model_capabilities_example(client: UniversalLLMClient):
+    """Example of checking model capabilities."""
     models_to_check = [
         "gpt-4",
         "claude-3-opus-20240229",
@@ -95,6 +155,8 @@ async def model_capabilities_example():
         "mistral-large-latest",
     ]
 
+    # Capability lookups are resolved locally without any network I/O, so a
+    # plain loop is already as fast as it gets (no need for asyncio.gather).
     for model in models_to_check:
         try:
             capabilities = client.get_model_capabilities(model)
@@ -112,10 +174,8 @@ async def model_capabilities_example():
             print(f"Could not get capabilities for {model}: {e}")
 
 
-async def error_handling_example():
+async def error_handling_example(client: UniversalLLMClient):
     """Example of error handling."""
-    client = UniversalLLMClient()
-
     try:
         # This will fail if no API key is set
         response = await client.complete(messages=["Hello"], model="gpt-3.5-turbo")
@@ -130,37 +190,53 @@ async def error_handling_example():
         print(f"Error: {type(e).__name__}: {e}")
 
 
-async def main():
-    """Run all examples."""
-    print("=== Basic Completion Example ===")
+async def _run(title: str, factory):
+    """Print a header, run one example and report it as skipped if it fails."""
+    print(f"\n=== {title} Example ===")
     try:
-        await basic_completion_example()
+        await factory()
     except Exception as e:
         print(f"Skipped: {e}")
 
-    print("\n=== Explicit Provider Example ===")
-    try:
-        await explicit_provider_example()
-    except Exception as e:
-        print(f"Skipped: {e}")
 
-    print("\n=== Streaming Example ===")
-    try:
-        await streaming_example()
-    except Exception as e:
-        print(f"Skipped: {e}")
-
-    print("\n=== Multi-Provider Example ===")
-    try:
-        await multi_provider_example()
-    except Exception as e:
-        print(f"Skipped: {e}")
-
-    print("\n=== Model Capabilities Example ===")
-    await model_capabilities_example()
-
-    print("\n=== Error Handling Example ===")
-    await error_handling_example()
+async def main():
+    """Run all examples."""
+    # Share one client across the examples so HTTP connections are reused,
+    # and close them all when done. http_limits sizes the connection pool;
+    # raise it when running large batches, otherwise concurrent requests queue
+    # behind the default limit.
+    http_limits = {
+        "max_connections": 2000,
+        "max_keepalive_connections": 1500,
+        "timeout": 120.0,
+    }
+    async with UniversalLLMClient(http_limits=http_limits) as client:
+        # Open connections up front so the first request doesn't pay for the
+        # DNS + TCP + TLS handshake
+        await client.prewarm(ProviderType.OPENAI, ProviderType.ANTHROPIC)
+
+        # Supported models for all providers, looked up once and shared
+        all_models = client.get_supported_models()
+
+        prompts = [f"Give me one fun fact about the number {n}." for n in range(1, 21)]
+        examples = [
+            ("Basic Completion", lambda: basic_completion_example(client)),
+            ("Explicit Provider", lambda: explicit_provider_example(client)),
+            ("Streaming", lambda: streaming_example(client)),
+            ("Multi-Provider", lambda: multi_provider_example(client, all_models)),
+            (
+                "Batch Completion",
+                lambda: batch_completion_example(
+                    client, prompts, model="gpt-3.5-turbo"
+                ),
+            ),
+            ("Model Capabilities", lambda: model_capabilities_example(client)),
+            ("Error Handling", lambda: error_handling_example(client)),
+        ]
+        # The demos are independent, but they run one at a time so their
+        # output doesn't interleave
+        for title, factory in examples:
+            await _run(title, factory)
 
 
 if __name__ == "__main__":
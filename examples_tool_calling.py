@@ -5,74 +5,120 @@ This demonstrates how to use the MCP-compatible tool calling API
 with different LLM providers.
 """
 
+import ast
 import asyncio
 import json
-from univllm import UniversalLLMClient, ToolDefinition
-
-
-# Define tools using MCP format
-def get_weather_tool():
-    """Example weather tool definition."""
-    return ToolDefinition(
-        name="get_weather",
-        description="Get current weather information for a location",
-        input_schema={
-            "type": "object",
-            "properties": {
-                "location": {
-                    "type": "string",
-                    "description": "City name or zip code"
-                },
-                "units": {
-                    "type": "string",
-                    "enum": ["celsius", "fahrenheit"],
-                    "description": "Temperature units"
-                }
-            },
-            "required": ["location"]
-        }
-    )
+import re
+from functools import lru_cache
+from univllm import UniversalLLMClient, ProviderType, ToolDefinition
+
+# Use orjson for pretty-printing tool arguments when it is installed; it is a
+# drop-in, much faster replacement for json.dumps
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 
+except ImportError:
 
-def calculate_tool():
-    """Example calculator tool definition."""
-    return ToolDefinition(
-        name="calculate",
-        description="Perform basic arithmetic calculations",
-        input_schema={
-            "type": "object",
-            "properties": {
-                "expression": {
-                    "type": "string",
-                    "description": "Mathematical expression to evaluate (e.g., '2 + 2', '10 * 5')"
-                }
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# Define tools using MCP format. Tool definitions never change, so they are
+# built once at import time and shared by every request.
+WEATHER_TOOL = ToolDefinition(
+    name="get_weather",
+    description="Get current weather information for a location",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "location": {
+                "type": "string",
+                "description": "City name or zip code"
             },
-            "required": ["expression"]
-        }
-    )
+            "units": {
+                "type": "string",
+                "enum": ["celsius", "fahrenheit"],
+                "description": "Temperature units"
+            }
+        },
+        "required": ["location"]
+    }
+)
 
+CALCULATE_TOOL = ToolDefinition(
+    name="calculate",
+    description="Perform basic arithmetic calculations",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "expression": {
+                "type": "string",
+                "description": "Mathematical expression to evaluate (e.g., '2 + 2', '10 * 5')"
+            }
+        },
+        "required": ["expression"]
+    }
+)
 
-def search_tool():
-    """Example search tool definition."""
-    return ToolDefinition(
-        name="search_web",
-        description="Search the web for information",
-        input_schema={
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "Search query"
-                },
-                "max_results": {
-                    "type": "integer",
-                    "description": "Maximum number of results to return",
-                    "default": 5
-                }
+SEARCH_TOOL = ToolDefinition(
+    name="search_web",
+    description="Search the web for information",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query"
             },
-            "required": ["query"]
-        }
-    )
+            "max_results": {
+                "type": "integer",
+                "description": "Maximum number of results to return",
+                "default": 5
+            }
+        },
+        "required": ["query"]
+    }
+)
+
+
+# Only allow basic arithmetic with numbers in the calculator tool
+_SAFE_EXPR = re.compile(r"^[\d\s+\-*/().]+$")
+
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.Constant,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.Mod,
+    ast.USub,
+    ast.UAdd,
+)
+
+
+def _validate_expr(tree: ast.AST) -> None:
+    """Reject anything in the parsed expression that isn't plain arithmetic."""
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Disallowed syntax: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and not isinstance(
+            node.value, (int, float)
+        ):
+            raise ValueError(f"Disallowed constant: {node.value!r}")
+
+
+@lru_cache(maxsize=1024)
+def _compile_expr(expression: str):
+    """Parse, validate and compile an expression once; retries reuse the result."""
+    tree = ast.parse(expression, mode="eval")
+    _validate_expr(tree)
+    return compile(tree, "<calc>", "eval")
 
 
 # Simulate tool execution
@@ -90,17 +136,13 @@ def execute_tool(tool_name: str, arguments: dict) -> str:
     elif tool_name == "calculate":
         expression = arguments.get("expression")
         try:
-            # NOTE: In production, use a safe expression evaluator like simpleeval
-            # or ast.literal_eval for simple cases. Never use eval() with user input!
-            # This is for demonstration purposes only.
-            # Example safe alternative: from simpleeval import simple_eval
-            # result = simple_eval(expression)
-            
-            # For this example, we'll use a restricted approach
-            # Only allow basic arithmetic with numbers
-            import re
-            if re.match(r'^[\d\s\+\-\*\/\(\)\.]+$', expression):
-                result = eval(expression)  # Still not ideal, but safer with validation
+            # Never eval() raw user input. The character whitelist is a cheap
+            # first pass; the expression is then parsed and every AST node is
+            # checked to be plain arithmetic before the compiled code is run
+            # without access to builtins. Exponentiation is not allowed, as a
+            # tiny expression like 9**9**9 would tie up the worker for hours.
+            if _SAFE_EXPR.match(expression):
+                result = eval(_compile_expr(expression), {"__builtins__": {}}, {})
                 return f"Result: {result}"
             else:
                 return "Error: Expression contains disallowed characters"
@@ -117,14 +159,12 @@ def execute_tool(tool_name: str, arguments: dict) -> str:
         return f"Unknown tool: {tool_name}"
 
 
-async def basic_tool_calling_example():
+async def basic_tool_calling_example(client: UniversalLLMClient):
     """Basic example of tool calling with a single tool."""
     print("\n=== Basic Tool Calling Example ===\n")
     
-    client = UniversalLLMClient()
-    
     # Define available tools
-    tools = [get_weather_tool()]
+    tools = [WEATHER_TOOL]
     
     # Initial user request
     messages = [
@@ -144,7 +184,7 @@ async def basic_tool_calling_example():
     # Check if the model wants to call a tool
     if response.tool_calls:
         print(f"\nModel wants to call tool: {response.tool_calls[0].name}")
-        print(f"Arguments: {json.dumps(response.tool_calls[0].arguments, indent=2)}")
+        print(f"Arguments: {_dumps(response.tool_calls[0].arguments)}")
         
         # Execute the tool
         tool_result = execute_tool(
@@ -153,20 +193,23 @@ async def basic_tool_calling_example():
         )
         print(f"\nTool result: {tool_result}")
         
-        # Add assistant's tool call and tool result to conversation
+        # Add assistant's tool call and tool result to conversation using the
+        # native tool-call turns rather than describing them in prose
         messages.append({
             "role": "assistant",
-            "content": f"I need to check the weather. Calling {response.tool_calls[0].name}..."
+            "tool_calls": [response.tool_calls[0].model_dump()]
         })
         messages.append({
-            "role": "user",
-            "content": f"Tool result: {tool_result}"
+            "role": "tool",
+            "tool_call_id": response.tool_calls[0].id,
+            "content": tool_result
         })
         
         # Second API call - LLM uses tool result to generate final response
         final_response = await client.complete(
             messages=messages,
-            model="gpt-4o"
+            model="gpt-4o",
+            tools=tools
         )
         
         print(f"\nAssistant: {final_response.content}")
@@ -174,17 +217,15 @@ async def basic_tool_calling_example():
         print(f"\nAssistant: {response.content}")
 
 
-async def multiple_tools_example():
+async def multiple_tools_example(client: UniversalLLMClient):
     """Example with multiple tools available."""
     print("\n=== Multiple Tools Example ===\n")
     
-    client = UniversalLLMClient()
-    
     # Define multiple available tools
     tools = [
-        get_weather_tool(),
-        calculate_tool(),
-        search_tool()
+        WEATHER_TOOL,
+        CALCULATE_TOOL,
+        SEARCH_TOOL
     ]
     
     messages = [
@@ -203,22 +244,27 @@ async def multiple_tools_example():
     if response.tool_calls:
         print(f"\nModel wants to call {len(response.tool_calls)} tool(s):")
         
-        for tool_call in response.tool_calls:
+        # The tool calls are independent, so run them concurrently. Real tools
+        # usually block on I/O (weather API, web search), so each one runs in a
+        # worker thread to keep the event loop free.
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(execute_tool, tool_call.name, tool_call.arguments)
+                for tool_call in response.tool_calls
+            )
+        )
+        
+        for tool_call, result in zip(response.tool_calls, results):
             print(f"\n- {tool_call.name}")
-            print(f"  Arguments: {json.dumps(tool_call.arguments, indent=4)}")
-            
-            # Execute each tool
-            result = execute_tool(tool_call.name, tool_call.arguments)
+            print(f"  Arguments: {_dumps(tool_call.arguments)}")
             print(f"  Result: {result}")
 
 
-async def anthropic_tool_example():
+async def anthropic_tool_example(client: UniversalLLMClient):
     """Example using Anthropic/Claude with tools."""
     print("\n=== Anthropic Tool Calling Example ===\n")
     
-    client = UniversalLLMClient()
-    
-    tools = [calculate_tool()]
+    tools = [CALCULATE_TOOL]
     
     messages = [
         {"role": "user", "content": "What is 42 divided by 7?"}
@@ -234,7 +280,7 @@ async def anthropic_tool_example():
     
     if response.tool_calls:
         print(f"\nClaude wants to use: {response.tool_calls[0].name}")
-        print(f"Arguments: {json.dumps(response.tool_calls[0].arguments, indent=2)}")
+        print(f"Arguments: {_dumps(response.tool_calls[0].arguments)}")
         
         # Execute the tool
         result = execute_tool(
@@ -245,44 +291,44 @@ async def anthropic_tool_example():
         print(f"\nClaude's message: {response.content}")
 
 
-async def tool_choice_example():
+async def tool_choice_example(client: UniversalLLMClient):
     """Example demonstrating different tool_choice options."""
     print("\n=== Tool Choice Options Example ===\n")
     
-    client = UniversalLLMClient()
-    tools = [get_weather_tool(), calculate_tool()]
+    tools = [WEATHER_TOOL, CALCULATE_TOOL]
+    
+    # The two requests are independent, so send them concurrently
+    results = await asyncio.gather(
+        *(
+            client.complete(
+                messages=[{"role": "user", "content": "What's the weather in Tokyo?"}],
+                model="gpt-4o",
+                tools=tools,
+                tool_choice=choice
+            )
+            for choice in ("none", "auto")
+        )
+    )
     
     # Force no tool use
     print("1. tool_choice='none' - Force the model to NOT use tools:")
-    response = await client.complete(
-        messages=[{"role": "user", "content": "What's the weather in Tokyo?"}],
-        model="gpt-4o",
-        tools=tools,
-        tool_choice="none"
-    )
+    response = results[0]
     print(f"   Response: {response.content}")
     print(f"   Tool calls: {response.tool_calls}")
     
     # Let model decide (auto)
     print("\n2. tool_choice='auto' - Let the model decide:")
-    response = await client.complete(
-        messages=[{"role": "user", "content": "What's the weather in Tokyo?"}],
-        model="gpt-4o",
-        tools=tools,
-        tool_choice="auto"
-    )
+    response = results[1]
     if response.tool_calls:
         print(f"   Model chose to use: {response.tool_calls[0].name}")
     else:
         print(f"   Model chose not to use tools")
 
 
-async def dict_format_example():
+async def dict_format_example(client: UniversalLLMClient):
     """Example using dictionary format for tools (MCP compatible)."""
     print("\n=== Dictionary Format Example ===\n")
     
-    client = UniversalLLMClient()
-    
     # Define tools as dictionaries (MCP format)
     tools = [
         {
@@ -309,7 +355,7 @@ async def dict_format_example():
     
     if response.tool_calls:
         print(f"Tool called: {response.tool_calls[0].name}")
-        print(f"Arguments: {json.dumps(response.tool_calls[0].arguments, indent=2)}")
+        print(f"Arguments: {_dumps(response.tool_calls[0].arguments)}")
 
 
 async def main():
@@ -319,13 +365,18 @@ async def main():
     print("=" * 60)
     
     # Note: These examples demonstrate the API usage but require valid API keys
-    # Uncomment the examples you want to run:
-    
-    # await basic_tool_calling_example()
-    # await multiple_tools_example()
-    # await anthropic_tool_example()
-    # await tool_choice_example()
-    # await dict_format_example()
+    # Uncomment the examples you want to run. A single client is shared so
+    # HTTP connections are reused across examples.
+    async with UniversalLLMClient() as client:
+        # Open connections up front so the first request doesn't pay for the
+        # DNS + TCP + TLS handshake
+        await client.prewarm(ProviderType.OPENAI, ProviderType.ANTHROPIC)
+
+        # await basic_tool_calling_example(client)
+        # await multiple_tools_example(client)
+        # await anthropic_tool_example(client)
+        # await tool_choice_example(client)
+        # await dict_format_example(client)
     
     print("\n" + "=" * 60)
     print("Note: Set OPENAI_API_KEY and ANTHROPIC_API_KEY environment")
@@ -0,0 +1,51 @@
+"""Shared fixtures for the Gemini provider tests."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from univllm import UniversalLLMClient, ProviderType
+
+
+@pytest.fixture
+def gemini_response():
+    """Build a mock generate_content response with a single text part."""
+
+    def make(text: str = "OK") -> MagicMock:
+        part = MagicMock()
+        part.text = text
+        candidate = MagicMock()
+        candidate.content.parts = [part]
+        candidate.finish_reason = "STOP"
+        response = MagicMock()
+        response.candidates = [candidate]
+        response.usage_metadata = None
+        return response
+
+    return make
+
+
+@pytest.fixture
+def gemini_client(monkeypatch):
+    """Build a Gemini client, replacing SDK model methods passed by name.
+
+    For example ``gemini_client(generate_content=fake, max_retries=1)``
+    patches ``client.aio.models.generate_content``; other keyword arguments
+    are passed to ``UniversalLLMClient``.
+    """
+
+    def make(**kwargs) -> UniversalLLMClient:
+        methods = {
+            name: kwargs.pop(name)
+            for name in ("generate_content", "generate_content_stream")
+            if name in kwargs
+        }
+        client = UniversalLLMClient(
+            provider=ProviderType.GEMINI, api_key="test_key", **kwargs
+        )
+        for name, method in methods.items():
+            monkeypatch.setattr(
+                client.provider_instance.client.aio.models, name, method
+            )
+        return client
+
+    return make
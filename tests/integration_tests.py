@@ -1,33 +1,51 @@
-import pytest
+import asyncio
+import os
 
+import pytest
 
-@pytest.mark.parametrize(
-    "model",
-    [
-        # "gpt-5-nano",
-        # "claude-3-7-sonnet-latest",
-        # "deepseek-chat",
-        # "mistral-small-latest",
-    ],
+from univllm import UniversalLLMClient, ProviderType
+from univllm.exceptions import (
+    AuthenticationError,
+    ProviderError,
+    ModelNotSupportedError,
 )
-def test_all_providers(model):
+
+
+# Uncomment models to test specific providers
+MODELS = [
+    # "gpt-5-nano",
+    # "claude-3-7-sonnet-latest",
+    # "deepseek-chat",
+    # "mistral-small-latest",
+]
+
+
+@pytest.mark.asyncio
+async def test_all_providers():
     """
     Warning: This test will make real API calls. Ensure you have set the necessary
     environment variables for authentication (e.g., OPENAI_API_KEY, ANTHROPIC_API_KEY, etc.)
-    and be aware of potential costs. Uncomment models in the parametrize list to test specific providers.
-    """
-    from univllm import UniversalLLMClient
-
-    client = UniversalLLMClient()
+    and be aware of potential costs. Uncomment models in MODELS to test specific providers.
 
-    async def run_test():
-        response = await client.complete(["Hello, how are you?"], model=model)
-        print(f"Response from {model}:", response)
-        assert response is not None
+    All models are queried concurrently, so the test takes as long as the slowest
+    provider. Providers without credentials are skipped.
+    """
+    if not MODELS:
+        pytest.skip("No models enabled; uncomment entries in MODELS")
 
-    import asyncio
+    async with UniversalLLMClient() as client:
+        results = await asyncio.gather(
+            *(client.complete(["Hello, how are you?"], model=model) for model in MODELS),
+            return_exceptions=True,
+        )
 
-    asyncio.run(run_test())
+    for model, result in zip(MODELS, results):
+        print(f"Response from {model}:", result)
+        if isinstance(result, AuthenticationError):
+            continue
+        if isinstance(result, BaseException):
+            raise result
+        assert result is not None
 
 
 def test_vision_generate_image_openai():
@@ -37,10 +55,6 @@ def test_vision_generate_image_openai():
     It requests a small 256x256 image to reduce cost and retrieves the
     image data in base64 format without writing to disk.
     """
-    import os
-    from univllm import UniversalLLMClient
-    from univllm.exceptions import ProviderError, ModelNotSupportedError
-
     if not os.getenv("OPENAI_API_KEY"):
         pytest.skip("OPENAI_API_KEY not set; skipping real image generation test")
 
@@ -73,52 +87,57 @@ def test_vision_generate_image_openai():
             # Spot check base64 length (should be reasonably large for even tiny images)
             assert len(img.b64_json) > 100
 
-    import asyncio
-
     asyncio.run(run_test())
 
 
-def test_image_generation_unsupported_model():
+@pytest.mark.asyncio
+async def test_image_generation_unsupported_model():
     """Test error handling for unsupported models/providers during image generation.
 
     Covers:
     1. Completely unsupported model name -> ModelNotSupportedError
     2. Supported provider & model (OpenAI gpt-4o) but not an image model -> ModelNotSupportedError
     3. Provider that does not implement image generation (Deepseek) -> NotImplementedError
-    """
-    import os
-    import asyncio
-    from univllm import UniversalLLMClient, ProviderType
-    from univllm.exceptions import ModelNotSupportedError
 
+    The cases are independent, so they run concurrently on a single event loop.
+    """
     client = UniversalLLMClient()
+    # Use a separate client initialized with dummy Deepseek key to avoid env dependency
+    deepseek_client = UniversalLLMClient(provider=ProviderType.DEEPSEEK, api_key="dummy")
+    has_openai_key = bool(os.getenv("OPENAI_API_KEY"))
 
-    # 1. Completely unsupported model name (no provider autodetect)
-    with pytest.raises(ModelNotSupportedError):
-        asyncio.run(
+    cases = [
+        # 1. Completely unsupported model name (no provider autodetect)
+        (
+            ModelNotSupportedError,
             client.generate_image(
                 prompt="test", model="totally-unknown-model"  # no gpt/claude/etc substring
-            )
-        )
+            ),
+        ),
+        # 3. Provider without image generation implementation (Deepseek)
+        # generate_image will call BaseLLMProvider.generate_image -> NotImplementedError
+        (
+            NotImplementedError,
+            deepseek_client.generate_image(
+                prompt="robot", model="deepseek-chat", provider=ProviderType.DEEPSEEK
+            ),
+        ),
+    ]
 
     # 2. Non-image OpenAI model (requires API key or skip)
-    if os.getenv("OPENAI_API_KEY"):
-        with pytest.raises(ModelNotSupportedError):
-            asyncio.run(
+    if has_openai_key:
+        cases.append(
+            (
+                ModelNotSupportedError,
                 client.generate_image(
                     prompt="icon", model="gpt-4o"  # valid OpenAI model but not image
-                )
-            )
-    else:
-        pytest.skip("Skipping OpenAI non-image model test: OPENAI_API_KEY not set")
-
-    # 3. Provider without image generation implementation (Deepseek)
-    # Use a separate client initialized with dummy Deepseek key to avoid env dependency
-    deepseek_client = UniversalLLMClient(provider=ProviderType.DEEPSEEK, api_key="dummy")
-    # generate_image will call BaseLLMProvider.generate_image -> NotImplementedError
-    with pytest.raises(NotImplementedError):
-        asyncio.run(
-            deepseek_client.generate_image(
-                prompt="robot", model="deepseek-chat", provider=ProviderType.DEEPSEEK
+                ),
             )
         )
+
+    results = await asyncio.gather(*(coro for _, coro in cases), return_exceptions=True)
+    for (expected_error, _), result in zip(cases, results):
+        assert isinstance(result, expected_error)
+
+    if not has_openai_key:
+        pytest.skip("Skipping OpenAI non-image model test: OPENAI_API_KEY not set")
@@ -109,6 +109,253 @@ def test_supported_models_structure():
     for provider, model_list in models.items():
         assert isinstance(model_list, list)
 
+    # The mapping is computed once and reused
+    assert client.get_supported_models() is models
+    assert client.get_supported_models(ProviderType.GEMINI) == {
+        ProviderType.GEMINI: models[ProviderType.GEMINI]
+    }
+
+
+def test_provider_instances_are_reused():
+    """Test that switching between providers reuses existing instances."""
+    client = UniversalLLMClient(api_key="test_key")
+
+    openai_provider = client._get_provider("gpt-4o")
+    anthropic_provider = client._get_provider("claude-sonnet-4-5")
+
+    assert client._get_provider("gpt-5") is openai_provider
+    assert client._get_provider("claude-opus-4-5") is anthropic_provider
+    assert client.provider_type == ProviderType.ANTHROPIC
+
+
+@pytest.mark.asyncio
+async def test_client_context_manager_closes_providers():
+    """Test that leaving the async context closes every provider."""
+    closed = []
+
+    async with UniversalLLMClient(api_key="test_key") as client:
+        for model in ("gpt-4o", "claude-sonnet-4-5"):
+            provider = client._get_provider(model)
+
+            async def fake_close(provider_type=provider.provider_type):
+                closed.append(provider_type)
+
+            provider.close = fake_close
+
+    assert sorted(closed) == [ProviderType.ANTHROPIC, ProviderType.OPENAI]
+    assert client.provider_instance is None
+
+
+@pytest.mark.asyncio
+async def test_client_closes_providers_replaced_by_set_provider():
+    """Test that providers replaced by set_provider are closed on exit."""
+    async with UniversalLLMClient() as client:
+        client.set_provider(ProviderType.GEMINI, api_key="replaced_key")
+        first = client.provider_instance
+        client.set_provider(ProviderType.GEMINI, api_key="replaced_key")
+        second = client.provider_instance
+        assert second is not first
+
+    assert first._http_client.is_closed
+    assert second._http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_prewarm_is_best_effort(monkeypatch):
+    """Test that prewarm warms each provider and ignores failures."""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    client = UniversalLLMClient()
+    client.set_provider(ProviderType.OPENAI, api_key="test_key")
+    warmed = []
+
+    async def fake_prewarm():
+        warmed.append(ProviderType.OPENAI)
+
+    client.provider_instance.prewarm = fake_prewarm
+
+    # Anthropic cannot be initialised without a key; that must not raise
+    await client.prewarm(ProviderType.OPENAI, ProviderType.ANTHROPIC)
+
+    assert warmed == [ProviderType.OPENAI]
+    assert ProviderType.ANTHROPIC not in client._providers
+
+
+@pytest.mark.asyncio
+async def test_gemini_prewarm_opens_several_connections(monkeypatch):
+    """Test that Gemini prewarm issues one request per connection to warm."""
+    provider = UniversalLLMClient(api_key="test_key")._get_provider("gemini-2.5-pro")
+    calls = []
+
+    async def fake_list():
+        calls.append(1)
+
+    monkeypatch.setattr(provider.client.aio.models, "list", fake_list)
+
+    await provider.prewarm()
+
+    assert len(calls) == 4
+
+
+def test_gemini_http2_requires_h2(monkeypatch):
+    """Test that http2=True without h2 installed is a configuration error."""
+    import importlib.util
+    from univllm.exceptions import ConfigurationError
+
+    if importlib.util.find_spec("h2") is not None:
+        pytest.skip("h2 is installed")
+
+    with pytest.raises(ConfigurationError, match="h2"):
+        UniversalLLMClient(api_key="http2_key", http2=True)._get_provider(
+            "gemini-2.5-pro"
+        )
+
+
+def test_gemini_http2_client():
+    """Test that http2=True builds an HTTP/2 pool with few keep-alive sockets."""
+    pytest.importorskip("h2")
+
+    provider = UniversalLLMClient(api_key="http2_key", http2=True)._get_provider(
+        "gemini-2.5-pro"
+    )
+    pool = provider._http_client._transport._pool
+    assert pool._http2 is True
+    assert pool._max_keepalive_connections == 4
+
+
+def test_http_limits_configure_provider_pools():
+    """Test that http_limits reaches the providers' HTTP clients."""
+    http_limits = {
+        "max_connections": 200,
+        "max_keepalive_connections": 50,
+        "timeout": 120.0,
+    }
+    client = UniversalLLMClient(api_key="test_key", http_limits=http_limits)
+
+    deepseek = client._get_provider("deepseek-chat")
+    pool = deepseek.client._transport._pool
+    assert pool._max_connections == 200
+    assert pool._max_keepalive_connections == 50
+    assert deepseek.client.timeout.read == 120.0
+
+    openai_provider = client._get_provider("gpt-4o")
+    assert openai_provider.client._client._transport._pool._max_connections == 200
+
+    # Gemini takes the timeout per request, in milliseconds
+    gemini = client._get_provider("gemini-2.5-pro")
+    assert gemini.client._api_client._http_options.timeout == 120000
+
+
+@pytest.mark.asyncio
+async def test_gemini_client_is_shared_per_api_key():
+    """Test that Gemini providers share one pooled SDK client per API key."""
+    first = UniversalLLMClient(api_key="shared_key")._get_provider("gemini-2.5-pro")
+    second = UniversalLLMClient(api_key="shared_key")._get_provider("gemini-2.5-flash")
+    other = UniversalLLMClient(api_key="other_key")._get_provider("gemini-2.5-pro")
+
+    assert second.client is first.client
+    assert other.client is not first.client
+    pool = first._http_client._transport._pool
+    assert pool._max_connections == 50
+    assert pool._max_keepalive_connections == 20
+
+    # The shared client stays open until its last user closes
+    await first.close()
+    await first.close()
+    assert not second._http_client.is_closed
+    await second.close()
+    assert second._http_client.is_closed
+    await other.close()
+
+    # Later instances then start a fresh pool
+    fresh = UniversalLLMClient(api_key="shared_key")._get_provider("gemini-2.5-pro")
+    assert fresh.client is not first.client
+    await fresh.close()
+
+
+def test_gemini_client_is_not_shared_across_event_loops():
+    """Test that a new event loop does not reuse connections of a closed one."""
+    import asyncio
+
+    async def make_provider():
+        return UniversalLLMClient(api_key="loop_key")._get_provider("gemini-2.5-pro")
+
+    first = asyncio.run(make_provider())
+    second = asyncio.run(make_provider())
+
+    assert second.client is not first.client
+    assert second._http_client is not first._http_client
+
+
+def test_gemini_parse_response_with_sdk_types():
+    """Test parsing a real SDK response with missing token counts."""
+    from google.genai import types
+    from univllm.models import CompletionRequest
+
+    provider = UniversalLLMClient(api_key="test_key")._get_provider("gemini-2.5-pro")
+    response = types.GenerateContentResponse(
+        candidates=[
+            types.Candidate(
+                content=types.Content(
+                    role="model",
+                    parts=[
+                        types.Part(text="Checking"),
+                        types.Part(
+                            function_call=types.FunctionCall(
+                                name="get_weather", args={"location": "Paris"}
+                            )
+                        ),
+                    ],
+                ),
+                finish_reason=types.FinishReason.STOP,
+            )
+        ],
+        usage_metadata=types.GenerateContentResponseUsageMetadata(
+            prompt_token_count=12
+        ),
+    )
+    request = CompletionRequest(
+        messages=[Message(role=MessageRole.USER, content="Weather?")],
+        model="gemini-2.5-pro",
+    )
+
+    completion = provider._parse_response(response, request)
+
+    assert completion.content == "Checking"
+    assert completion.tool_calls[0].name == "get_weather"
+    assert completion.tool_calls[0].arguments == {"location": "Paris"}
+    assert completion.usage == {
+        "prompt_tokens": 12,
+        "completion_tokens": 0,
+        "total_tokens": 0,
+    }
+    assert completion.finish_reason == str(types.FinishReason.STOP)
+
+
+def test_gemini_generation_config_is_reused():
+    """Test that identical generation parameters share one config."""
+    from univllm.models import CompletionRequest, ToolDefinition
+
+    provider = UniversalLLMClient(api_key="test_key")._get_provider("gemini-2.5-pro")
+    messages = [Message(role=MessageRole.USER, content="Hi")]
+    request = CompletionRequest(messages=messages, model="gemini-2.5-pro", top_p=0.5)
+    with_tools = request.model_copy(
+        update={
+            "tools": [ToolDefinition(name="ping", description="Ping", input_schema={})],
+            "tool_choice": "auto",
+        }
+    )
+
+    config = provider._build_config(request, "Be brief")
+    assert provider._build_config(request, "Be brief") is config
+    assert config.system_instruction == "Be brief"
+    assert config.top_p == 0.5
+
+    tools_config = provider._build_config(with_tools, "Be brief")
+    assert tools_config.tools[0].function_declarations[0].name == "ping"
+    assert tools_config.tool_config.function_calling_config.mode == "AUTO"
+    # Tools are added to a copy, never to the shared config
+    assert config.tools is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
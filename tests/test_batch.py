@@ -0,0 +1,177 @@
+"""Tests for batched completions."""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock
+
+from google.genai import types
+
+from univllm import UniversalLLMClient, ProviderType
+from univllm.exceptions import ProviderError
+from univllm.models import CompletionRequest, CompletionResponse
+
+
+def _request(model: str, content: str) -> CompletionRequest:
+    return CompletionRequest(
+        messages=UniversalLLMClient._process_messages([content]), model=model
+    )
+
+
+@pytest.mark.asyncio
+async def test_complete_batch_bounds_concurrency():
+    """Test that the default complete_batch caps requests in flight."""
+    client = UniversalLLMClient(api_key="test_key", max_concurrency=2)
+    provider = client._get_provider("deepseek-chat")
+    in_flight = 0
+    peak = 0
+
+    async def fake_complete(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return CompletionResponse(
+            content=request.messages[0].content,
+            model=request.model,
+            provider=ProviderType.DEEPSEEK,
+        )
+
+    provider.complete = fake_complete
+
+    requests = [_request("deepseek-chat", str(n)) for n in range(6)]
+    responses = await client.complete_batch(requests)
+
+    assert [r.content for r in responses] == [str(n) for n in range(6)]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_complete_batch_groups_by_provider():
+    """Test that mixed-provider batches keep the order of the requests."""
+    client = UniversalLLMClient(api_key="test_key")
+
+    for model in ("deepseek-chat", "mistral-large-3"):
+        provider = client._get_provider(model)
+
+        async def fake_complete(request, provider_type=provider.provider_type):
+            return CompletionResponse(
+                content=request.messages[0].content,
+                model=request.model,
+                provider=provider_type,
+            )
+
+        provider.complete = fake_complete
+
+    requests = [
+        _request("deepseek-chat", "a"),
+        _request("mistral-large-3", "b"),
+        _request("deepseek-chat", "c"),
+    ]
+    responses = await client.complete_batch(requests)
+
+    assert [r.content for r in responses] == ["a", "b", "c"]
+    assert [r.provider for r in responses] == [
+        ProviderType.DEEPSEEK,
+        ProviderType.MISTRAL,
+        ProviderType.DEEPSEEK,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_gemini_complete_batch_uses_batch_api(monkeypatch, gemini_response):
+    """Test that large same-model Gemini batches go through the Batch API."""
+    client = UniversalLLMClient(
+        provider=ProviderType.GEMINI, api_key="test_key", batch_threshold=2
+    )
+    provider = client.provider_instance
+    submitted = {}
+
+    async def fake_create(model, src):
+        submitted["model"] = model
+        submitted["src"] = src
+        return MagicMock(state=types.JobState.JOB_STATE_RUNNING)
+
+    async def fake_get(name):
+        job = MagicMock(state=types.JobState.JOB_STATE_SUCCEEDED)
+        job.dest.inlined_responses = [
+            MagicMock(response=gemini_response(text), error=None)
+            for text in ("one", "two")
+        ]
+        return job
+
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(provider.client.aio.batches, "create", fake_create)
+    monkeypatch.setattr(provider.client.aio.batches, "get", fake_get)
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+
+    responses = await client.complete_batch(
+        [_request("gemini-2.5-flash", "1"), _request("gemini-2.5-flash", "2")]
+    )
+
+    assert submitted["model"] == "gemini-2.5-flash"
+    assert len(submitted["src"]) == 2
+    assert [r.content for r in responses] == ["one", "two"]
+
+
+@pytest.mark.asyncio
+async def test_gemini_complete_batch_failed_job(monkeypatch):
+    """Test that a failed Gemini batch job raises ProviderError."""
+    client = UniversalLLMClient(
+        provider=ProviderType.GEMINI, api_key="test_key", batch_threshold=1
+    )
+    provider = client.provider_instance
+
+    async def fake_create(model, src):
+        return MagicMock(state=types.JobState.JOB_STATE_FAILED)
+
+    monkeypatch.setattr(provider.client.aio.batches, "create", fake_create)
+
+    with pytest.raises(ProviderError):
+        await client.complete_batch([_request("gemini-2.5-flash", "1")])
+
+
+@pytest.mark.asyncio
+async def test_gemini_complete_batch_missing_responses(monkeypatch, gemini_response):
+    """Test that a batch job returning fewer responses raises ProviderError."""
+    client = UniversalLLMClient(
+        provider=ProviderType.GEMINI, api_key="test_key", batch_threshold=2
+    )
+    provider = client.provider_instance
+
+    async def fake_create(model, src):
+        job = MagicMock(state=types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED)
+        job.dest.inlined_responses = [
+            MagicMock(response=gemini_response("one"), error=None)
+        ]
+        return job
+
+    monkeypatch.setattr(provider.client.aio.batches, "create", fake_create)
+
+    with pytest.raises(ProviderError, match="1 responses for 2 requests"):
+        await client.complete_batch(
+            [_request("gemini-2.5-flash", "1"), _request("gemini-2.5-flash", "2")]
+        )
+
+
+@pytest.mark.asyncio
+async def test_gemini_complete_batch_times_out(monkeypatch):
+    """Test that polling stops once batch_timeout has passed."""
+    client = UniversalLLMClient(
+        provider=ProviderType.GEMINI,
+        api_key="test_key",
+        batch_threshold=1,
+        batch_timeout=0,
+    )
+    provider = client.provider_instance
+
+    async def fake_create(model, src):
+        return MagicMock(state=types.JobState.JOB_STATE_RUNNING)
+
+    monkeypatch.setattr(provider.client.aio.batches, "create", fake_create)
+
+    with pytest.raises(ProviderError, match="did not finish"):
+        await client.complete_batch([_request("gemini-2.5-flash", "1")])
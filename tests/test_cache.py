@@ -0,0 +1,370 @@
+"""Tests for response caching."""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock
+
+from univllm import UniversalLLMClient, ProviderType, MemoryCache, SemanticCache
+from univllm.cache import make_cache_key
+from univllm.models import (
+    CompletionRequest,
+    CompletionResponse,
+    Message,
+    MessageRole,
+)
+
+
+def _request(**kwargs) -> CompletionRequest:
+    return CompletionRequest(
+        messages=[Message(role=MessageRole.USER, content="Hello")],
+        model="gemini-2.5-flash",
+        **kwargs,
+    )
+
+
+def test_cache_key_is_stable_for_identical_requests():
+    """Test that identical deterministic requests share a key."""
+    assert make_cache_key(_request()) == make_cache_key(_request())
+    assert make_cache_key(_request(temperature=0)) == make_cache_key(_request())
+    assert make_cache_key(_request(max_tokens=10)) != make_cache_key(_request())
+
+
+def test_cache_key_skips_sampled_requests():
+    """Test that requests with a non-zero temperature are not cached."""
+    assert make_cache_key(_request(temperature=0.7)) is None
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_expiry_and_eviction():
+    """Test that MemoryCache honours ttl and max_entries."""
+    cache = MemoryCache(max_entries=2)
+
+    await cache.set("expired", {"content": "old"}, ttl=0)
+    assert await cache.get("expired") is None
+
+    await cache.set("a", {"content": "a"})
+    await cache.set("b", {"content": "b"})
+    await cache.get("a")  # "b" is now the least recently used
+    await cache.set("c", {"content": "c"})
+
+    assert await cache.get("a") == {"content": "a"}
+    assert await cache.get("b") is None
+    assert await cache.get("c") == {"content": "c"}
+
+
+@pytest.mark.asyncio
+async def test_gemini_complete_uses_cache(gemini_client, gemini_response):
+    """Test that repeated deterministic Gemini requests hit the API once."""
+    calls = []
+
+    async def mock_generate_content(**kwargs):
+        calls.append(kwargs)
+        return gemini_response("Hi there")
+
+    client = gemini_client(generate_content=mock_generate_content, cache=MemoryCache())
+
+    for _ in range(3):
+        response = await client.complete(messages=["Hello"], model="gemini-2.5-flash")
+        assert response.content == "Hi there"
+    assert len(calls) == 1
+
+    # Sampled requests always go to the API
+    await client.complete(messages=["Hello"], model="gemini-2.5-flash", temperature=1)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_matches_similar_embeddings():
+    """Test that SemanticCache returns the closest entry above the threshold."""
+    cache = SemanticCache()
+    response = CompletionResponse(
+        content="Philadelphia is...", model="gemini-2.5-flash", provider="gemini"
+    )
+    await cache.add([1.0, 0.0], response, namespace="ctx")
+
+    assert await cache.query([0.99, 0.05], 0.92, namespace="ctx") is response
+    assert await cache.query([0.0, 1.0], 0.92, namespace="ctx") is None
+    assert await cache.query([0.99, 0.05], 0.92, namespace="other") is None
+
+
+@pytest.mark.asyncio
+async def test_gemini_complete_uses_semantic_cache(
+    monkeypatch, gemini_client, gemini_response
+):
+    """Test that near-duplicate Gemini prompts are served from the cache."""
+    embeddings = {
+        "Tell me about Philadelphia": [1.0, 0.0, 0.1],
+        "Talk to me about the city of Philadelphia": [0.98, 0.02, 0.12],
+        "Write a poem": [0.0, 1.0, 0.0],
+    }
+    calls = []
+
+    async def mock_embed_content(model, contents):
+        result = MagicMock()
+        result.embeddings[0].values = embeddings[contents]
+        return result
+
+    async def mock_generate_content(**kwargs):
+        calls.append(kwargs)
+        return gemini_response("Answer")
+
+    client = gemini_client(
+        generate_content=mock_generate_content, semantic_cache=SemanticCache()
+    )
+    monkeypatch.setattr(
+        client.provider_instance.client.aio.models,
+        "embed_content",
+        mock_embed_content,
+    )
+
+    first = await client.complete(
+        messages=["Tell me about Philadelphia"], model="gemini-2.5-flash"
+    )
+    assert first.usage is None
+
+    similar = await client.complete(
+        messages=["Talk to me about the city of Philadelphia"],
+        model="gemini-2.5-flash",
+    )
+    assert similar.content == "Answer"
+    assert similar.usage == {"cache_hit": 1}
+    assert len(calls) == 1
+
+    await client.complete(messages=["Write a poem"], model="gemini-2.5-flash")
+    # High temperatures bypass the semantic cache
+    await client.complete(
+        messages=["Tell me about Philadelphia"],
+        model="gemini-2.5-flash",
+        temperature=0.9,
+    )
+    assert len(calls) == 3
+
+
+def test_gemini_cacheable_messages_are_sent_first():
+    """Test that cacheable messages form the head of the Gemini contents."""
+    client = UniversalLLMClient(provider=ProviderType.GEMINI, api_key="test_key")
+    messages = client._process_messages(
+        [
+            {"role": "user", "content": "Question"},
+            {"role": "user", "content": "Reference document", "cacheable": True},
+            {"role": "assistant", "content": "Answer"},
+        ]
+    )
+    request = CompletionRequest(messages=messages, model="gemini-2.5-flash")
+
+    _, contents = client.provider_instance._build_contents(request)
+
+    assert [c.parts[0].text for c in contents] == [
+        "Reference document",
+        "Question",
+        "Answer",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_gemini_context_cache_reuses_prefix(
+    monkeypatch, gemini_client, gemini_response
+):
+    """Test that the cacheable prefix is stored once and referenced by name."""
+    created = []
+    calls = []
+
+    async def mock_create(model, config):
+        created.append(config)
+        cached_content = MagicMock()
+        cached_content.name = "cachedContents/abc"
+        return cached_content
+
+    async def mock_generate_content(**kwargs):
+        calls.append(kwargs)
+        return gemini_response("Answer")
+
+    client = gemini_client(generate_content=mock_generate_content, context_cache=True)
+    monkeypatch.setattr(
+        client.provider_instance.client.aio.caches, "create", mock_create
+    )
+
+    for question in ("First question", "Second question"):
+        await client.complete(
+            messages=[
+                {"role": "system", "content": "Answer from the document."},
+                {"role": "user", "content": "Long document", "cacheable": True},
+                {"role": "user", "content": question},
+            ],
+            model="gemini-2.5-flash",
+        )
+
+    assert len(created) == 1
+    assert created[0].system_instruction == "Answer from the document."
+    assert created[0].contents[0].parts[0].text == "Long document"
+    assert [c["contents"][0].parts[0].text for c in calls] == [
+        "First question",
+        "Second question",
+    ]
+    assert all(c["config"].cached_content == "cachedContents/abc" for c in calls)
+    assert all(c["config"].system_instruction is None for c in calls)
+
+
+@pytest.mark.asyncio
+async def test_gemini_context_cache_deduplicates_concurrent_creates(
+    monkeypatch, gemini_client, gemini_response
+):
+    """Test that concurrent first requests with one prefix create one cache."""
+    created = []
+
+    async def slow_create(model, config):
+        created.append(config)
+        await asyncio.sleep(0.01)
+        cached_content = MagicMock()
+        cached_content.name = "cachedContents/abc"
+        return cached_content
+
+    async def mock_generate_content(**kwargs):
+        return gemini_response("Answer")
+
+    client = gemini_client(generate_content=mock_generate_content, context_cache=True)
+    monkeypatch.setattr(
+        client.provider_instance.client.aio.caches, "create", slow_create
+    )
+
+    await asyncio.gather(
+        *(
+            client.complete(
+                messages=[
+                    {"role": "user", "content": "Long document", "cacheable": True},
+                    {"role": "user", "content": f"Question {n}"},
+                ],
+                model="gemini-2.5-flash",
+            )
+            for n in range(5)
+        )
+    )
+
+    assert len(created) == 1
+
+
+@pytest.mark.asyncio
+async def test_gemini_semantic_cache_skips_tool_result_follow_ups(
+    monkeypatch, gemini_client, gemini_response
+):
+    """Test that a tool-result follow-up is not answered from the cache."""
+    calls = []
+
+    async def mock_embed_content(model, contents):
+        result = MagicMock()
+        result.embeddings[0].values = [1.0, 0.0]
+        return result
+
+    async def mock_generate_content(**kwargs):
+        calls.append(kwargs)
+        return gemini_response("Answer")
+
+    client = gemini_client(
+        generate_content=mock_generate_content, semantic_cache=SemanticCache()
+    )
+    monkeypatch.setattr(
+        client.provider_instance.client.aio.models,
+        "embed_content",
+        mock_embed_content,
+    )
+    tool_call = {"id": "call_1", "name": "get_weather", "arguments": {}}
+    question = {"role": "user", "content": "Weather in Paris?"}
+
+    await client.complete(messages=[question], model="gemini-2.5-flash")
+    follow_up = await client.complete(
+        messages=[
+            question,
+            {"role": "assistant", "tool_calls": [tool_call]},
+            {"role": "tool", "tool_call_id": "call_1", "content": "18°C"},
+        ],
+        model="gemini-2.5-flash",
+    )
+
+    assert follow_up.usage is None
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_gemini_context_cache_prefix_with_parallel_tool_results(
+    monkeypatch, gemini_client, gemini_response
+):
+    """Test that merged tool results don't pull later turns into the prefix."""
+    created = []
+    calls = []
+
+    async def mock_create(model, config):
+        created.append(config)
+        cached_content = MagicMock()
+        cached_content.name = "cachedContents/abc"
+        return cached_content
+
+    async def mock_generate_content(**kwargs):
+        calls.append(kwargs)
+        return gemini_response("Answer")
+
+    client = gemini_client(generate_content=mock_generate_content, context_cache=True)
+    monkeypatch.setattr(
+        client.provider_instance.client.aio.caches, "create", mock_create
+    )
+    tool_calls = [
+        {"id": f"call_{n}", "name": "lookup", "arguments": {}} for n in (1, 2)
+    ]
+
+    cached = {"cacheable": True}
+
+    await client.complete(
+        messages=[
+            {"role": "user", "content": "Look these up", **cached},
+            {"role": "assistant", "tool_calls": tool_calls, **cached},
+            {"role": "tool", "tool_call_id": "call_1", "content": "A", **cached},
+            {"role": "tool", "tool_call_id": "call_2", "content": "B", **cached},
+            {"role": "user", "content": "First question"},
+            {"role": "assistant", "content": "First answer"},
+            {"role": "user", "content": "Second question"},
+        ],
+        model="gemini-2.5-flash",
+    )
+
+    assert len(created[0].contents) == 3
+    assert len(created[0].contents[2].parts) == 2
+    assert [c.parts[0].text for c in calls[0]["contents"]] == [
+        "First question",
+        "First answer",
+        "Second question",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_gemini_context_cache_failure_sends_request_uncached(
+    monkeypatch, gemini_client, gemini_response
+):
+    """Test that an unexpected caches.create error doesn't fail the request."""
+    created = []
+    calls = []
+
+    async def failing_create(model, config):
+        created.append(config)
+        raise RuntimeError("connection reset")
+
+    async def mock_generate_content(**kwargs):
+        calls.append(kwargs)
+        return gemini_response("Answer")
+
+    client = gemini_client(generate_content=mock_generate_content, context_cache=True)
+    monkeypatch.setattr(
+        client.provider_instance.client.aio.caches, "create", failing_create
+    )
+    messages = [
+        {"role": "user", "content": "Long document", "cacheable": True},
+        {"role": "user", "content": "Question"},
+    ]
+
+    for _ in range(2):
+        response = await client.complete(messages=messages, model="gemini-2.5-flash")
+        assert response.content == "Answer"
+
+    # The failure is not remembered, so each request tries again
+    assert len(created) == 2
+    assert all(c["config"].cached_content is None for c in calls)
+    assert len(calls[0]["contents"]) == 2
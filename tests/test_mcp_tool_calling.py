@@ -8,6 +8,7 @@ import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from univllm import UniversalLLMClient, ProviderType, ToolDefinition, ToolCall
+from univllm.models import CompletionRequest
 
 
 @pytest.fixture
@@ -515,5 +516,127 @@ class TestMCPToolCallSimulation:
         assert response.tool_calls[0].arguments["location"] == "New York"
 
 
+class TestToolResultMessages:
+    """Test that tool call / tool result turns use each provider's native format."""
+
+    @pytest.fixture
+    def tool_turns(self):
+        """Conversation with an assistant tool call followed by its result."""
+        tool_call = ToolCall(
+            id="call_123", name="get_weather", arguments={"location": "New York"}
+        )
+        return [
+            {"role": "user", "content": "What's the weather in New York?"},
+            {"role": "assistant", "tool_calls": [tool_call.model_dump()]},
+            {
+                "role": "tool",
+                "tool_call_id": "call_123",
+                "content": "72°F, partly cloudy",
+            },
+        ]
+
+    def test_openai_tool_result_format(self, tool_turns):
+        """Test OpenAI-style providers emit tool_calls and tool role messages."""
+        client = UniversalLLMClient(provider=ProviderType.OPENAI, api_key="test_key")
+        request = CompletionRequest(
+            messages=client._process_messages(tool_turns), model="gpt-4o"
+        )
+
+        messages = client.provider_instance.prepare_request(request)["messages"]
+
+        assert messages[1]["role"] == "assistant"
+        assert messages[1]["content"] is None
+        function = messages[1]["tool_calls"][0]["function"]
+        assert messages[1]["tool_calls"][0]["id"] == "call_123"
+        assert function["name"] == "get_weather"
+        assert json.loads(function["arguments"]) == {"location": "New York"}
+        assert messages[2] == {
+            "role": "tool",
+            "content": "72°F, partly cloudy",
+            "tool_call_id": "call_123",
+        }
+
+    def test_anthropic_tool_result_format(self, tool_turns):
+        """Test Anthropic receives tool_use and tool_result content blocks."""
+        client = UniversalLLMClient(
+            provider=ProviderType.ANTHROPIC, api_key="test_key"
+        )
+        request = CompletionRequest(
+            messages=client._process_messages(tool_turns),
+            model="claude-sonnet-4-5",
+        )
+
+        messages = client.provider_instance.prepare_request(request)["messages"]
+
+        assert messages[1] == {
+            "role": "assistant",
+            "content": [
+                {
+                    "type": "tool_use",
+                    "id": "call_123",
+                    "name": "get_weather",
+                    "input": {"location": "New York"},
+                }
+            ],
+        }
+        assert messages[2] == {
+            "role": "user",
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": "call_123",
+                    "content": "72°F, partly cloudy",
+                }
+            ],
+        }
+
+    def test_gemini_tool_result_format(self, tool_turns):
+        """Test Gemini receives function_call and function_response parts."""
+        client = UniversalLLMClient(provider=ProviderType.GEMINI, api_key="test_key")
+        request = CompletionRequest(
+            messages=client._process_messages(tool_turns), model="gemini-2.5-flash"
+        )
+
+        _, contents = client.provider_instance._build_contents(request)
+
+        function_call = contents[1].parts[0].function_call
+        assert contents[1].role == "model"
+        assert function_call.name == "get_weather"
+        assert function_call.args == {"location": "New York"}
+        function_response = contents[2].parts[0].function_response
+        assert function_response.name == "get_weather"
+        assert function_response.response == {"result": "72°F, partly cloudy"}
+
+    def test_gemini_parallel_tool_results_share_one_content(self):
+        """Test Gemini groups the results of parallel tool calls in one turn."""
+        client = UniversalLLMClient(provider=ProviderType.GEMINI, api_key="test_key")
+        tool_calls = [
+            ToolCall(id="call_1", name="get_weather", arguments={"location": "Paris"}),
+            ToolCall(id="call_2", name="calculate", arguments={"expression": "2+2"}),
+        ]
+        messages = client._process_messages(
+            [
+                {"role": "user", "content": "Weather in Paris, and 2+2?"},
+                {
+                    "role": "assistant",
+                    "tool_calls": [tool_call.model_dump() for tool_call in tool_calls],
+                },
+                {"role": "tool", "tool_call_id": "call_1", "content": "18°C"},
+                {"role": "tool", "tool_call_id": "call_2", "content": "4"},
+            ]
+        )
+        request = CompletionRequest(messages=messages, model="gemini-2.5-flash")
+
+        _, contents = client.provider_instance._build_contents(request)
+
+        assert len(contents) == 3
+        assert len(contents[1].parts) == 2
+        assert contents[2].role == "user"
+        assert [part.function_response.name for part in contents[2].parts] == [
+            "get_weather",
+            "calculate",
+        ]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
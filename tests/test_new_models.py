@@ -82,5 +82,19 @@ def test_legacy_models_still_work():
     assert client._auto_detect_provider("mistral-medium-latest") == ProviderType.MISTRAL
 
 
+def test_gemini_model_capabilities():
+    """Test Gemini capability lookup by model prefix."""
+    client = UniversalLLMClient(api_key="test_key")
+
+    pro = client.get_model_capabilities("gemini-1.5-pro-002")
+    assert pro.context_window == 2000000
+    assert pro.supports_vision is True
+    assert client.get_model_capabilities("gemini-2.5-flash").context_window == 1000000
+
+    # Modifying a result must not leak into later lookups
+    pro.context_window = 1
+    assert client.get_model_capabilities("gemini-1.5-pro").context_window == 2000000
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,146 @@
+"""Tests for Gemini concurrency limits, rate limiting, retries and errors."""
+
+import asyncio
+import time
+
+import pytest
+
+from google.genai import errors
+
+from univllm.exceptions import AuthenticationError, ProviderError
+from univllm.providers import gemini_provider
+from univllm.providers.gemini_provider import _TokenBucket
+
+
+def _api_error(code, status, **error):
+    error_cls = errors.ServerError if code >= 500 else errors.ClientError
+    return error_cls(code, {"error": {"code": code, "status": status, **error}})
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_requests_are_retried(
+    monkeypatch, gemini_client, gemini_response
+):
+    """Test that 429 errors are retried with exponential backoff."""
+    attempts = []
+    delays = []
+
+    async def flaky_generate_content(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) < 3:
+            raise _api_error(429, "RESOURCE_EXHAUSTED", message="Quota exceeded")
+        return gemini_response()
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    client = gemini_client(generate_content=flaky_generate_content)
+    monkeypatch.setattr(gemini_provider.asyncio, "sleep", fake_sleep)
+
+    response = await client.complete(messages=["Hi"], model="gemini-2.5-flash")
+
+    assert response.content == "OK"
+    assert len(attempts) == 3
+    assert 1.0 <= delays[0] <= 1.5
+    assert 2.0 <= delays[1] <= 3.0
+
+
+@pytest.mark.asyncio
+async def test_retries_give_up_after_max_retries(monkeypatch, gemini_client):
+    """Test that persistent rate limiting surfaces as ProviderError."""
+    attempts = []
+
+    async def rate_limited(**kwargs):
+        attempts.append(kwargs)
+        raise _api_error(429, "RESOURCE_EXHAUSTED")
+
+    async def fake_sleep(delay):
+        pass
+
+    client = gemini_client(generate_content=rate_limited, max_retries=1)
+    monkeypatch.setattr(gemini_provider.asyncio, "sleep", fake_sleep)
+
+    with pytest.raises(ProviderError, match="rate limit"):
+        await client.complete(messages=["Hi"], model="gemini-2.5-flash")
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_other_errors_are_not_retried(gemini_client):
+    """Test that non rate-limit errors fail immediately."""
+    attempts = []
+
+    async def failing(**kwargs):
+        attempts.append(kwargs)
+        raise _api_error(500, "INTERNAL")
+
+    client = gemini_client(generate_content=failing)
+
+    with pytest.raises(ProviderError):
+        await client.complete(messages=["Hi"], model="gemini-2.5-flash")
+    assert len(attempts) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [
+        _api_error(403, "PERMISSION_DENIED"),
+        _api_error(
+            400,
+            "INVALID_ARGUMENT",
+            message="API key not valid. Please pass a valid API key.",
+            details=[{"reason": "API_KEY_INVALID"}],
+        ),
+    ],
+)
+async def test_auth_errors_map_to_authentication_error(gemini_client, error):
+    """Test that auth failures are classified from the typed SDK error."""
+
+    async def failing(**kwargs):
+        raise error
+
+    client = gemini_client(generate_content=failing)
+
+    with pytest.raises(AuthenticationError):
+        await client.complete(messages=["Hi"], model="gemini-2.5-flash")
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_requests_bounds_calls(gemini_client, gemini_response):
+    """Test that max_concurrent_requests caps concurrent generate_content calls."""
+    in_flight = 0
+    peak = 0
+
+    async def slow_generate_content(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return gemini_response()
+
+    client = gemini_client(
+        generate_content=slow_generate_content, max_concurrent_requests=3
+    )
+
+    await asyncio.gather(
+        *(
+            client.complete(messages=[str(n)], model="gemini-2.5-flash")
+            for n in range(10)
+        )
+    )
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests():
+    """Test that the token bucket delays requests beyond its burst."""
+    bucket = _TokenBucket(requests_per_minute=6000)  # 100 per second
+
+    start = time.monotonic()
+    for _ in range(int(bucket.capacity) + 2):
+        await bucket.acquire()
+
+    assert time.monotonic() - start >= 0.015
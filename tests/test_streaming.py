@@ -0,0 +1,103 @@
+"""Tests for streamed completions."""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock
+
+from univllm.exceptions import ProviderError
+
+
+def _fake_stream(fragments, delay=0.0):
+    async def fake_stream():
+        for text in fragments:
+            if delay:
+                await asyncio.sleep(delay)
+            chunk = MagicMock()
+            chunk.text = text
+            yield chunk
+
+    async def fake_generate_content_stream(**kwargs):
+        return fake_stream()
+
+    return fake_generate_content_stream
+
+
+async def _collect(client):
+    return [
+        chunk
+        async for chunk in client.stream_complete(
+            messages=["Hello"], model="gemini-2.5-flash"
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_gemini_stream_coalesces_small_chunks(gemini_client):
+    """Test that tiny fragments are merged up to stream_flush_chars."""
+    fragments = ["ab"] * 10
+    client = gemini_client(
+        generate_content_stream=_fake_stream(fragments),
+        stream_flush_chars=8,
+        stream_flush_ms=1000,
+    )
+
+    chunks = await _collect(client)
+
+    assert chunks == ["abababab", "abababab", "abab"]
+
+
+@pytest.mark.asyncio
+async def test_gemini_stream_flushes_on_timer(gemini_client):
+    """Test that buffered text is yielded when the next fragment is slow."""
+    fragments = ["a", "b", "c"]
+    client = gemini_client(
+        generate_content_stream=_fake_stream(fragments, delay=0.05),
+        stream_flush_chars=64,
+        stream_flush_ms=5,
+    )
+
+    chunks = await _collect(client)
+
+    assert chunks == fragments
+
+
+@pytest.mark.asyncio
+async def test_gemini_stream_coalescing_can_be_disabled(gemini_client):
+    """Test that stream_flush_chars=0 yields every fragment."""
+    fragments = ["a", "b", "c"]
+    client = gemini_client(
+        generate_content_stream=_fake_stream(fragments), stream_flush_chars=0
+    )
+
+    assert await _collect(client) == fragments
+
+
+@pytest.mark.asyncio
+async def test_gemini_stream_flushes_buffer_before_error(gemini_client):
+    """Test that text buffered before a stream error is still yielded."""
+
+    async def failing_stream():
+        for text in ("a", "b"):
+            chunk = MagicMock()
+            chunk.text = text
+            yield chunk
+        raise RuntimeError("connection reset")
+
+    async def fake_generate_content_stream(**kwargs):
+        return failing_stream()
+
+    client = gemini_client(
+        generate_content_stream=fake_generate_content_stream,
+        stream_flush_chars=64,
+        stream_flush_ms=1000,
+    )
+    chunks = []
+
+    with pytest.raises(ProviderError, match="connection reset"):
+        async for chunk in client.stream_complete(
+            messages=["Hello"], model="gemini-2.5-flash"
+        ):
+            chunks.append(chunk)
+
+    assert chunks == ["ab"]
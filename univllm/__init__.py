@@ -6,12 +6,16 @@ including OpenAI, Anthropic, Deepseek, and Mistral.
 """
 
 from .client import UniversalLLMClient
+from .cache import CacheBackend, MemoryCache, SemanticCache
 from .models import ProviderType, ToolDefinition, ToolCall, ToolResult
 from .exceptions import UniversalLLMError, ProviderError, ModelNotSupportedError
 from .supported_models import is_unsupported_model
 
 __all__ = [
     "UniversalLLMClient",
+    "CacheBackend",
+    "MemoryCache",
+    "SemanticCache",
     "ProviderType",
     "ToolDefinition",
     "ToolCall",
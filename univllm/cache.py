@@ -0,0 +1,154 @@
+"""Response caching for completion requests."""
+
+import hashlib
+import json
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Protocol, Sequence, Tuple
+
+from .models import CompletionRequest, CompletionResponse
+
+
+class CacheBackend(Protocol):
+    """Interface for response caches.
+
+    Any object with these two coroutines can be passed as ``cache``, so an
+    in-memory, Redis or file backend are interchangeable.
+    """
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for ``key``, or None on a miss."""
+        ...
+
+    async def set(
+        self, key: str, value: Dict[str, Any], ttl: Optional[float] = None
+    ) -> None:
+        """Store ``value`` under ``key``, expiring after ``ttl`` seconds."""
+        ...
+
+
+class MemoryCache:
+    """In-process LRU cache implementing ``CacheBackend``."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept before the least
+                recently used one is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(
+        self, key: str, value: Dict[str, Any], ttl: Optional[float] = None
+    ) -> None:
+        """Store ``value`` under ``key``, expiring after ``ttl`` seconds."""
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class SemanticCache:
+    """In-process cache matching prompts by embedding similarity.
+
+    Entries are compared by cosine similarity with a linear scan, which is
+    fast enough for a few thousand entries.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept before the oldest one
+                is evicted
+        """
+        self._entries: Deque[Tuple[str, List[float], float, CompletionResponse]] = (
+            deque(maxlen=max_entries)
+        )
+
+    async def query(
+        self, embedding: Sequence[float], threshold: float, namespace: str = ""
+    ) -> Optional[CompletionResponse]:
+        """Return the most similar cached response above ``threshold``.
+
+        Args:
+            embedding: Embedding of the prompt
+            threshold: Minimum cosine similarity for a hit
+            namespace: Only entries added with the same namespace are matched
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        norm = _norm(embedding)
+        if not norm:
+            return None
+
+        best_score, best_response = threshold, None
+        for entry_namespace, vector, vector_norm, response in self._entries:
+            if entry_namespace != namespace or len(vector) != len(embedding):
+                continue
+            dot = sum(a * b for a, b in zip(embedding, vector))
+            score = dot / (norm * vector_norm)
+            if score >= best_score:
+                best_score, best_response = score, response
+        return best_response
+
+    async def add(
+        self,
+        embedding: Sequence[float],
+        response: CompletionResponse,
+        namespace: str = "",
+    ) -> None:
+        """Store ``response`` for prompts similar to ``embedding``."""
+        norm = _norm(embedding)
+        if norm:
+            self._entries.append((namespace, list(embedding), norm, response))
+
+
+def _norm(vector: Sequence[float]) -> float:
+    return math.sqrt(sum(x * x for x in vector))
+
+
+def make_cache_key(request: CompletionRequest) -> Optional[str]:
+    """Build a cache key for a deterministic completion request.
+
+    Args:
+        request: Completion request
+
+    Returns:
+        A sha256 hex digest of the canonical request, or None if the request
+        is sampled with a non-zero temperature and should not be cached
+    """
+    if request.temperature not in (None, 0):
+        return None
+
+    payload = {
+        "model": request.model,
+        "messages": [msg.model_dump(mode="json") for msg in request.messages],
+        "max_tokens": request.max_tokens,
+        "top_p": request.top_p,
+        "tools": [tool.model_dump(mode="json") for tool in request.tools or []],
+        "tool_choice": request.tool_choice,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
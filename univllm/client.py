@@ -1,6 +1,7 @@
 """Universal LLM client with factory pattern for provider selection."""
 
-from typing import Dict, Optional, AsyncIterator
+import asyncio
+from typing import Dict, List, Optional, AsyncIterator
 from .models import (
     CompletionRequest,
     CompletionResponse,
@@ -43,6 +44,11 @@ class UniversalLLMClient:
         self.provider_instance: Optional[BaseLLMProvider] = None
         self.provider_type = provider
         self.config = kwargs
+        # Providers are kept per type so their HTTP connections can be reused
+        self._providers: Dict[ProviderType, BaseLLMProvider] = {}
+        # Instances replaced by set_provider, closed along with the others
+        self._replaced_providers: List[BaseLLMProvider] = []
+        self._supported_models: Optional[Dict[ProviderType, list]] = None
 
         if provider:
             self._initialize_provider(provider, **kwargs)
@@ -58,8 +64,86 @@ class UniversalLLMClient:
             raise ProviderError(f"Unsupported provider: {provider}")
 
         provider_class = self._provider_classes[provider]
+        replaced = self._providers.get(provider)
         self.provider_instance = provider_class(**kwargs)
+        if replaced is not None:
+            self._replaced_providers.append(replaced)
         self.provider_type = provider
+        self._providers[provider] = self.provider_instance
+
+    def _get_provider(
+        self, model: str, provider: Optional[ProviderType] = None
+    ) -> BaseLLMProvider:
+        """Return the provider instance to use for a model.
+
+        Instances are created on first use and reused afterwards.
+
+        Args:
+            model: Model identifier
+            provider: Provider to use (if not specified, will auto-detect)
+
+        Returns:
+            Provider instance
+        """
+        if not provider:
+            provider = self._auto_detect_provider(model)
+
+        return self._provider_for(provider)
+
+    def _provider_for(self, provider: ProviderType) -> BaseLLMProvider:
+        """Return the provider instance for a provider type, creating it if needed.
+
+        Args:
+            provider: The provider type
+
+        Returns:
+            Provider instance
+        """
+        instance = self._providers.get(provider)
+        if instance is None:
+            self._initialize_provider(provider, **self.config)
+        else:
+            self.provider_instance = instance
+            self.provider_type = provider
+
+        return self.provider_instance
+
+    async def prewarm(self, *providers: ProviderType) -> None:
+        """Open connections to providers before the first real request.
+
+        Warm-up is best effort: providers that cannot be reached or
+        initialised (e.g. missing API key) are skipped silently, and the
+        error will surface on the first real request instead.
+
+        Args:
+            *providers: Provider types to warm up (if none, warms up the
+                providers already created by this client)
+        """
+
+        async def _prewarm(provider: ProviderType) -> None:
+            await self._provider_for(provider).prewarm()
+
+        targets = providers or tuple(self._providers)
+        await asyncio.gather(
+            *(_prewarm(provider) for provider in targets), return_exceptions=True
+        )
+
+    async def close(self) -> None:
+        """Close all provider instances created by this client."""
+        providers = [*self._providers.values(), *self._replaced_providers]
+        self._providers.clear()
+        self._replaced_providers.clear()
+        self.provider_instance = None
+        for provider_instance in providers:
+            await provider_instance.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
 
     def _auto_detect_provider(self, model: str) -> ProviderType:
         """Auto-detect provider based on model name without instantiation."""
@@ -103,25 +187,27 @@ class UniversalLLMClient:
     ) -> Dict[ProviderType, list]:
         """Get supported models for all or specific provider using class-level data.
 
+        The mapping is built once per client and shared between calls, so
+        treat the returned lists as read-only.
+
         Args:
             provider: Specific provider to get models for (if None, gets all)
 
         Returns:
             Dictionary mapping provider types to their supported models
         """
+        if self._supported_models is None:
+            self._supported_models = {
+                provider_type: list(getattr(provider_class, "SUPPORTED_MODELS", []))
+                for provider_type, provider_class in self._provider_classes.items()
+            }
+
         if provider:
-            if provider not in self._provider_classes:
+            if provider not in self._supported_models:
                 raise ProviderError(f"Unsupported provider: {provider}")
-            provider_class = self._provider_classes[provider]
-            return {provider: list(getattr(provider_class, "SUPPORTED_MODELS", []))}
-
-        all_models: Dict[ProviderType, list] = {}
-        for provider_type, provider_class in self._provider_classes.items():
-            all_models[provider_type] = list(
-                getattr(provider_class, "SUPPORTED_MODELS", [])
-            )
+            return {provider: self._supported_models[provider]}
 
-        return all_models
+        return self._supported_models
 
     def get_model_capabilities(
         self, model: str, provider: Optional[ProviderType] = None
@@ -135,13 +221,46 @@ class UniversalLLMClient:
         Returns:
             Model capabilities
         """
-        if not provider:
-            provider = self._auto_detect_provider(model)
+        return self._get_provider(model, provider).get_model_capabilities(model)
 
-        if not self.provider_instance or self.provider_type != provider:
-            self._initialize_provider(provider, **self.config)
+    @staticmethod
+    def _process_messages(messages: list) -> list:
+        """Convert strings and dicts to Message objects.
 
-        return self.provider_instance.get_model_capabilities(model)
+        Args:
+            messages: List of messages (strings, dicts or Message objects)
+
+        Returns:
+            List of Message objects
+        """
+        processed_messages = []
+        for i, msg in enumerate(messages):
+            if isinstance(msg, str):
+                # First message is system if only one, otherwise alternate user/assistant
+                if i == 0 and len(messages) == 1:
+                    role = MessageRole.USER
+                elif i == 0:
+                    role = MessageRole.SYSTEM
+                elif i % 2 == 1:
+                    role = MessageRole.USER
+                else:
+                    role = MessageRole.ASSISTANT
+                processed_messages.append(Message(role=role, content=msg))
+            elif isinstance(msg, dict):
+                # Assistant tool-call turns may have no (or None) content
+                processed_messages.append(
+                    Message(
+                        role=MessageRole(msg["role"]),
+                        content=msg.get("content") or "",
+                        tool_calls=msg.get("tool_calls"),
+                        tool_call_id=msg.get("tool_call_id"),
+                        name=msg.get("name"),
+                        cacheable=msg.get("cacheable", False),
+                    )
+                )
+            else:
+                processed_messages.append(msg)
+        return processed_messages
 
     async def complete(
         self,
@@ -171,32 +290,9 @@ class UniversalLLMClient:
         Returns:
             Completion response
         """
-        if not provider:
-            provider = self._auto_detect_provider(model)
-
-        if not self.provider_instance or self.provider_type != provider:
-            self._initialize_provider(provider, **self.config)
+        provider_instance = self._get_provider(model, provider)
 
-        # Convert messages to Message objects if they're strings
-        processed_messages = []
-        for i, msg in enumerate(messages):
-            if isinstance(msg, str):
-                # First message is system if only one, otherwise alternate user/assistant
-                if i == 0 and len(messages) == 1:
-                    role = MessageRole.USER
-                elif i == 0:
-                    role = MessageRole.SYSTEM
-                elif i % 2 == 1:
-                    role = MessageRole.USER
-                else:
-                    role = MessageRole.ASSISTANT
-                processed_messages.append(Message(role=role, content=msg))
-            elif isinstance(msg, dict):
-                processed_messages.append(
-                    Message(role=MessageRole(msg["role"]), content=msg["content"])
-                )
-            else:
-                processed_messages.append(msg)
+        processed_messages = self._process_messages(messages)
 
         # Convert tools to ToolDefinition objects if they're dicts
         from .models import ToolDefinition
@@ -220,7 +316,47 @@ class UniversalLLMClient:
             extra_params=kwargs,
         )
 
-        return await self.provider_instance.complete(request)
+        return await provider_instance.complete(request)
+
+    async def complete_batch(
+        self,
+        requests: List[CompletionRequest],
+        provider: Optional[ProviderType] = None,
+    ) -> List[CompletionResponse]:
+        """Generate completions for several requests.
+
+        Requests are grouped by provider and each group is sent with the
+        provider's ``complete_batch``, so they run concurrently (or through a
+        batch API where the provider supports one).
+
+        Args:
+            requests: Completion requests
+            provider: Provider to use (if not specified, will auto-detect per
+                request)
+
+        Returns:
+            Completion responses, in the same order as ``requests``
+        """
+        groups: Dict[BaseLLMProvider, List[int]] = {}
+        for index, request in enumerate(requests):
+            provider_instance = self._get_provider(request.model, provider)
+            groups.setdefault(provider_instance, []).append(index)
+
+        responses: List[Optional[CompletionResponse]] = [None] * len(requests)
+
+        async def _complete_group(
+            provider_instance: BaseLLMProvider, indexes: List[int]
+        ) -> None:
+            results = await provider_instance.complete_batch(
+                [requests[i] for i in indexes]
+            )
+            for i, result in zip(indexes, results):
+                responses[i] = result
+
+        await asyncio.gather(
+            *(_complete_group(p, indexes) for p, indexes in groups.items())
+        )
+        return responses
 
     async def stream_complete(
         self,
@@ -246,32 +382,9 @@ class UniversalLLMClient:
         Yields:
             Chunks of the completion
         """
-        if not provider:
-            provider = self._auto_detect_provider(model)
+        provider_instance = self._get_provider(model, provider)
 
-        if not self.provider_instance or self.provider_type != provider:
-            self._initialize_provider(provider, **self.config)
-
-        # Convert messages to Message objects if they're strings
-        processed_messages = []
-        for i, msg in enumerate(messages):
-            if isinstance(msg, str):
-                # First message is system if only one, otherwise alternate user/assistant
-                if i == 0 and len(messages) == 1:
-                    role = MessageRole.USER
-                elif i == 0:
-                    role = MessageRole.SYSTEM
-                elif i % 2 == 1:
-                    role = MessageRole.USER
-                else:
-                    role = MessageRole.ASSISTANT
-                processed_messages.append(Message(role=role, content=msg))
-            elif isinstance(msg, dict):
-                processed_messages.append(
-                    Message(role=MessageRole(msg["role"]), content=msg["content"])
-                )
-            else:
-                processed_messages.append(msg)
+        processed_messages = self._process_messages(messages)
 
         request = CompletionRequest(
             messages=processed_messages,
@@ -283,7 +396,7 @@ class UniversalLLMClient:
             extra_params=kwargs,
         )
 
-        async for chunk in self.provider_instance.stream_complete(request):
+        async for chunk in provider_instance.stream_complete(request):
             yield chunk
 
     async def generate_image(
@@ -299,10 +412,7 @@ class UniversalLLMClient:
 
         Size is optional; provider will apply model-specific defaults/validation.
         """
-        if not provider:
-            provider = self._auto_detect_provider(model)
-        if not self.provider_instance or self.provider_type != provider:
-            self._initialize_provider(provider, **self.config)
+        provider_instance = self._get_provider(model, provider)
         request = ImageGenerationRequest(
             prompt=prompt,
             model=model,
@@ -310,4 +420,4 @@ class UniversalLLMClient:
             response_format=response_format,
             extra_params=kwargs,
         )
-        return await self.provider_instance.generate_image(request)
+        return await provider_instance.generate_image(request)
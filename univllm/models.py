@@ -23,13 +23,7 @@ class MessageRole(str, Enum):
     SYSTEM = "system"
     USER = "user"
     ASSISTANT = "assistant"
-
-
-class Message(BaseModel):
-    """A message in a conversation."""
-
-    role: MessageRole
-    content: str
+    TOOL = "tool"
 
 
 class ToolDefinition(BaseModel):
@@ -61,6 +55,23 @@ class ToolResult(BaseModel):
     is_error: bool = False
 
 
+class Message(BaseModel):
+    """A message in a conversation.
+
+    Assistant messages may carry the ``tool_calls`` the model requested, and
+    ``tool`` messages carry a tool result for the call with ``tool_call_id``.
+    """
+
+    role: MessageRole
+    content: str = ""
+    tool_calls: Optional[List[ToolCall]] = None
+    tool_call_id: Optional[str] = None
+    name: Optional[str] = None  # Tool name, for tool result messages
+    # Static content (instructions, documents) shared by many requests; such
+    # messages are sent first so providers can cache the common prefix
+    cacheable: bool = False
+
+
 class ModelCapabilities(BaseModel):
     """Capabilities of a specific model."""
 
@@ -34,13 +34,23 @@ class AnthropicProvider(BaseLLMProvider):
             raise AuthenticationError("Anthropic API key is required")
 
         super().__init__(api_key=api_key, **kwargs)
-        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key, http_client=self._build_http_client()
+        )
 
     @property
     def provider_type(self) -> ProviderType:
         """Return the provider type."""
         return ProviderType.ANTHROPIC
 
+    async def prewarm(self) -> None:
+        """Open a pooled connection by listing the available models."""
+        await self.client.models.list()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self.client.close()
+
     def get_model_capabilities(self, model: str) -> ModelCapabilities:
         """Get capabilities for a specific Anthropic model."""
         if not self.validate_model(model):
@@ -111,6 +121,37 @@ class AnthropicProvider(BaseLLMProvider):
         for msg in request.messages:
             if msg.role == MessageRole.SYSTEM:
                 system_message = msg.content
+            elif msg.role == MessageRole.TOOL:
+                # Tool results are sent back as tool_result blocks in a user turn;
+                # results for the same assistant turn share one user message
+                block = {
+                    "type": "tool_result",
+                    "tool_use_id": msg.tool_call_id,
+                    "content": msg.content,
+                }
+                previous = messages[-1] if messages else None
+                if (
+                    previous
+                    and previous["role"] == "user"
+                    and isinstance(previous["content"], list)
+                ):
+                    previous["content"].append(block)
+                else:
+                    messages.append({"role": "user", "content": [block]})
+            elif msg.tool_calls:
+                content = []
+                if msg.content:
+                    content.append({"type": "text", "text": msg.content})
+                content.extend(
+                    {
+                        "type": "tool_use",
+                        "id": tool_call.id,
+                        "name": tool_call.name,
+                        "input": tool_call.arguments,
+                    }
+                    for tool_call in msg.tool_calls
+                )
+                messages.append({"role": msg.role.value, "content": content})
             else:
                 messages.append({"role": msg.role.value, "content": msg.content})
 
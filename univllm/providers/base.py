@@ -1,10 +1,16 @@
 """Base provider class for LLM interactions."""
 
+import asyncio
+import json
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, AsyncIterator
+import httpx
+
 from ..models import (
     CompletionRequest,
     CompletionResponse,
+    Message,
+    MessageRole,
     ModelCapabilities,
     ProviderType,
     ImageGenerationRequest,
@@ -23,11 +29,34 @@ class BaseLLMProvider(ABC):
 
         Args:
             api_key: API key for the provider
-            **kwargs: Additional provider-specific configuration
+            **kwargs: Additional provider-specific configuration. ``http_limits``
+                (a dict with ``max_connections``, ``max_keepalive_connections``,
+                ``keepalive_expiry`` and/or ``timeout``) configures the
+                connection pool of the underlying HTTP client.
+                ``max_concurrency`` caps the requests ``complete_batch`` runs
+                at once (default: 16).
         """
         self.api_key = api_key
         self.config = kwargs
 
+    def _build_http_client(self, **client_kwargs) -> Optional[httpx.AsyncClient]:
+        """Build an HTTP client from the ``http_limits`` option.
+
+        Args:
+            **client_kwargs: Additional ``httpx.AsyncClient`` arguments
+
+        Returns:
+            A configured ``httpx.AsyncClient``, or None if no limits were given
+        """
+        http_limits = self.config.get("http_limits")
+        if not http_limits:
+            return None
+
+        limits = dict(http_limits)
+        if "timeout" in limits:
+            client_kwargs["timeout"] = limits.pop("timeout")
+        return httpx.AsyncClient(limits=httpx.Limits(**limits), **client_kwargs)
+
     @property
     @abstractmethod
     def provider_type(self) -> ProviderType:
@@ -81,6 +110,29 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def complete_batch(
+        self, requests: List[CompletionRequest]
+    ) -> List[CompletionResponse]:
+        """Generate completions for several requests.
+
+        The default implementation runs the requests concurrently with at most
+        ``max_concurrency`` in flight. Providers with a batch API may override
+        this.
+
+        Args:
+            requests: Completion requests
+
+        Returns:
+            Completion responses, in the same order as ``requests``
+        """
+        semaphore = asyncio.Semaphore(self.config.get("max_concurrency", 16))
+
+        async def complete_one(request: CompletionRequest) -> CompletionResponse:
+            async with semaphore:
+                return await self.complete(request)
+
+        return list(await asyncio.gather(*(complete_one(r) for r in requests)))
+
     # --- Optional image generation interface ---
     async def generate_image(
         self, request: ImageGenerationRequest
@@ -93,10 +145,65 @@ class BaseLLMProvider(ABC):
             f"Image generation not implemented for provider {self.provider_type}"
         )
 
+    async def prewarm(self) -> None:
+        """Open a connection to the provider ahead of the first request.
+
+        Providers should override this with a cheap request so that DNS, TCP
+        and TLS setup is paid before user traffic arrives.
+        """
+        pass
+
+    async def close(self) -> None:
+        """Release any network resources held by the provider.
+
+        Providers that keep an HTTP client open should override this.
+        """
+        pass
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
     def validate_model(self, model: str) -> bool:
         """Validate if a model is supported by this provider."""
         return type(self).supports_model(model)
 
+    def format_message(self, msg: Message) -> Dict:
+        """Convert a message to the OpenAI-style chat format.
+
+        Args:
+            msg: Message to convert
+
+        Returns:
+            Dictionary formatted for the provider's API
+        """
+        data = {"role": msg.role.value, "content": msg.content}
+
+        if msg.tool_calls:
+            # Content is optional on assistant turns that only call tools
+            data["content"] = msg.content or None
+            data["tool_calls"] = [
+                {
+                    "id": tool_call.id,
+                    "type": "function",
+                    "function": {
+                        "name": tool_call.name,
+                        "arguments": json.dumps(tool_call.arguments),
+                    },
+                }
+                for tool_call in msg.tool_calls
+            ]
+        if msg.role == MessageRole.TOOL:
+            data["tool_call_id"] = msg.tool_call_id
+            if msg.name:
+                data["name"] = msg.name
+
+        return data
+
     def prepare_request(self, request: CompletionRequest) -> Dict:
         """Prepare request data for the provider's API format.
 
@@ -107,9 +214,7 @@ class BaseLLMProvider(ABC):
             Dictionary formatted for the provider's API
         """
         # Base implementation - providers can override
-        messages = [
-            {"role": msg.role.value, "content": msg.content} for msg in request.messages
-        ]
+        messages = [self.format_message(msg) for msg in request.messages]
 
         data = {
             "model": request.model,
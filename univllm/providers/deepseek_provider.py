@@ -37,7 +37,7 @@ class DeepseekProvider(BaseLLMProvider):
 
         super().__init__(api_key=api_key, **kwargs)
         self.base_url = base_url or "https://api.deepseek.com"
-        self.client = httpx.AsyncClient()
+        self.client = self._build_http_client() or httpx.AsyncClient()
 
     @property
     def provider_type(self) -> ProviderType:
@@ -196,10 +196,10 @@ class DeepseekProvider(BaseLLMProvider):
         except Exception as e:
             raise ProviderError(f"Deepseek provider error: {e}")
 
-    async def __aenter__(self):
-        """Async context manager entry."""
-        return self
+    async def prewarm(self) -> None:
+        """Open a pooled connection with a lightweight HEAD request."""
+        await self.client.head(self.base_url)
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
         await self.client.aclose()
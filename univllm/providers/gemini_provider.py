@@ -1,123 +1,706 @@
 """Gemini provider implementation."""
 
+import asyncio
+import hashlib
+import json
 import os
+import random
+import time
+from bisect import bisect_right
+from functools import lru_cache
 from typing import List, Optional, AsyncIterator, Dict, Tuple
+from weakref import WeakKeyDictionary
+import httpx
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 
+from ..cache import CacheBackend, SemanticCache, make_cache_key
 from ..supported_models import GEMINI_SUPPORTED_MODELS
 from ..models import (
     CompletionRequest,
     CompletionResponse,
+    Message,
     ModelCapabilities,
     MessageRole,
     ProviderType,
     ToolCall,
 )
-from ..exceptions import ProviderError, ModelNotSupportedError, AuthenticationError
+from ..exceptions import (
+    ProviderError,
+    ModelNotSupportedError,
+    AuthenticationError,
+    ConfigurationError,
+)
 from .base import BaseLLMProvider
 
 
+# Gemini calls the assistant "model"; other roles keep their names
+_GEMINI_ROLES = {"assistant": "model", "user": "user"}
+
+# Exponential backoff (in seconds) for retrying rate-limited requests
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+
+# Batch job states after which the job will not change any more
+_BATCH_SUCCESS_STATES = {
+    types.JobState.JOB_STATE_SUCCEEDED,
+    types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+}
+_BATCH_DONE_STATES = _BATCH_SUCCESS_STATES | {
+    types.JobState.JOB_STATE_FAILED,
+    types.JobState.JOB_STATE_CANCELLED,
+    types.JobState.JOB_STATE_EXPIRED,
+}
+
+
+def _gemini_capabilities(
+    context_window: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    supports_vision: bool = False,
+) -> ModelCapabilities:
+    return ModelCapabilities(
+        supports_system_messages=True,
+        supports_function_calling=True,
+        supports_streaming=True,
+        supports_vision=supports_vision,
+        context_window=context_window,
+        max_tokens=max_tokens,
+    )
+
+
+# Default capabilities for Gemini models
+_DEFAULT_CAPABILITIES = _gemini_capabilities()
+
+# Model-specific capabilities based on latest Gemini specifications
+_CAPABILITIES_BY_PREFIX: Dict[str, ModelCapabilities] = {
+    # Gemini 2.5 Pro - advanced reasoning
+    "gemini-2.5-pro": _gemini_capabilities(1000000, 8192, True),
+    # Gemini 2.5 Flash - price-performance
+    "gemini-2.5-flash": _gemini_capabilities(1000000, 8192, True),
+    # Gemini 2.0 Flash
+    "gemini-2.0-flash": _gemini_capabilities(1000000, 8192, True),
+    # Gemini 1.5 Pro
+    "gemini-1.5-pro": _gemini_capabilities(2000000, 8192, True),
+    # Gemini 1.5 Flash
+    "gemini-1.5-flash": _gemini_capabilities(1000000, 8192, True),
+}
+
+# Sorted prefixes for a bisect lookup, plus for each prefix the index of the
+# longest other prefix it starts with (-1 if none)
+_PREFIXES: List[str] = sorted(_CAPABILITIES_BY_PREFIX)
+_PREFIX_PARENTS: List[int] = [
+    max(
+        (j for j in range(i) if _PREFIXES[i].startswith(_PREFIXES[j])),
+        default=-1,
+    )
+    for i in range(len(_PREFIXES))
+]
+
+
+def _lookup_capabilities(model: str) -> ModelCapabilities:
+    """Return the capabilities entry for the longest prefix of ``model``."""
+    # The greatest prefix sorting at or before the model either matches or
+    # starts with the longest matching prefix, so follow its parents
+    i = bisect_right(_PREFIXES, model) - 1
+    while i >= 0 and not model.startswith(_PREFIXES[i]):
+        i = _PREFIX_PARENTS[i]
+    return _CAPABILITIES_BY_PREFIX[_PREFIXES[i]] if i >= 0 else _DEFAULT_CAPABILITIES
+
+
+def _is_rate_limit_error(e: Exception) -> bool:
+    return isinstance(e, errors.APIError) and e.code == 429
+
+
+def _is_auth_error(e: errors.APIError) -> bool:
+    if e.code in (401, 403):
+        return True
+    # An invalid key is reported as 400 INVALID_ARGUMENT with a structured reason
+    error = e.details.get("error") if isinstance(e.details, dict) else None
+    details = error.get("details") if isinstance(error, dict) else None
+    return any(
+        isinstance(detail, dict) and detail.get("reason") == "API_KEY_INVALID"
+        for detail in details or []
+    )
+
+
+class _TokenBucket:
+    """Token bucket limiting requests to a number per minute."""
+
+    def __init__(self, requests_per_minute: float) -> None:
+        self.rate = requests_per_minute / 60
+        # Allow a burst of up to one second's worth of requests
+        self.capacity = max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+@lru_cache(maxsize=256)
+def _base_config(
+    system_instruction: Optional[str],
+    max_tokens: Optional[int],
+    temperature: Optional[float],
+    top_p: Optional[float],
+) -> types.GenerateContentConfig:
+    """Build the generation config for the given parameters.
+
+    Results are cached and shared between requests, so they must not be
+    modified (the SDK copies the config before changing it).
+    """
+    config = types.GenerateContentConfig()
+    if system_instruction:
+        config.system_instruction = system_instruction
+    if max_tokens is not None:
+        config.max_output_tokens = max_tokens
+    if temperature is not None:
+        config.temperature = temperature
+    if top_p is not None:
+        config.top_p = top_p
+    return config
+
+
+async def _coalesce(
+    chunks: AsyncIterator[str], flush_chars: int, flush_ms: float
+) -> AsyncIterator[str]:
+    """Merge small text chunks from a stream.
+
+    Buffered text is yielded once it reaches ``flush_chars`` characters, once
+    ``flush_ms`` milliseconds have passed since the first buffered fragment, or
+    when the stream ends.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = chunks.__aiter__()
+    buffer: List[str] = []
+    size = 0
+    deadline = 0.0
+    # The pending read survives a timer flush; cancelling it (as wait_for
+    # would) could lose a chunk
+    pending = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            timeout = max(deadline - loop.time(), 0) if buffer else None
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+                continue
+
+            task, pending = pending, None
+            try:
+                text = task.result()
+            except StopAsyncIteration:
+                break
+            except Exception:
+                # Deliver the text received before the stream failed
+                if buffer:
+                    yield "".join(buffer)
+                raise
+            if not buffer:
+                deadline = loop.time() + flush_ms / 1000
+            buffer.append(text)
+            size += len(text)
+            if size >= flush_chars:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+    if buffer:
+        yield "".join(buffer)
+
+
+class _SharedClient:
+    """SDK client shared between Gemini providers, with a count of its users."""
+
+    def __init__(self, client: genai.Client, http_client: httpx.AsyncClient) -> None:
+        self.client = client
+        self.http_client = http_client
+        self.users = 0
+
+
 class GeminiProvider(BaseLLMProvider):
     """Gemini provider for Google Gemini models."""
 
     SUPPORTED_MODELS: List[str] = GEMINI_SUPPORTED_MODELS
 
+    # Connection pool used when no ``http_limits`` are configured
+    DEFAULT_HTTP_LIMITS: Dict[str, float] = {
+        "max_connections": 50,
+        "max_keepalive_connections": 20,
+        "keepalive_expiry": 30.0,
+    }
+    # HTTP/2 multiplexes requests over one connection, so keep fewer alive
+    DEFAULT_HTTP2_LIMITS: Dict[str, float] = {
+        "max_connections": 50,
+        "max_keepalive_connections": 4,
+        "keepalive_expiry": 30.0,
+    }
+
+    # SDK clients shared by every instance on the same event loop with the
+    # same API key and pool configuration, so connections and TLS sessions
+    # are reused: event loop -> cache key -> client
+    _client_cache: WeakKeyDictionary = WeakKeyDictionary()
+
     def __init__(self, api_key: Optional[str] = None, **kwargs) -> None:
         """Initialize Gemini provider.
 
         Args:
             api_key: Gemini API key (if not provided, will use GEMINI_API_KEY env var)
-            **kwargs: Additional configuration
+            **kwargs: Additional configuration. ``cache`` (a ``CacheBackend``)
+                enables caching of deterministic completions, with entries
+                expiring after ``cache_ttl`` seconds (default: never).
+                ``semantic_cache`` (a ``SemanticCache``) additionally answers
+                near-duplicate prompts whose embeddings (``embedding_model``)
+                reach ``semantic_cache_threshold`` cosine similarity.
+                ``batch_threshold`` makes ``complete_batch`` submit batches of
+                at least that many same-model requests to the Gemini Batch API
+                (default: disabled), waiting at most ``batch_timeout`` seconds
+                for the job to finish (default: 48 hours).
+                ``stream_flush_chars`` and ``stream_flush_ms`` control how
+                streamed text is merged: a chunk is yielded once that many
+                characters are buffered or that long has passed since the
+                first buffered fragment (defaults: 64 and 10). Set
+                ``stream_flush_chars`` to 0 to yield every fragment as is.
+                ``max_concurrent_requests`` caps concurrent ``complete`` calls
+                and ``qpm`` their rate in requests per minute (default: no
+                limits); this is separate from ``max_concurrency``, which
+                only bounds ``complete_batch``. Rate-limited calls are
+                retried with exponential backoff up to ``max_retries`` times
+                (default: 2).
+                ``context_cache`` stores the system instruction and messages
+                marked ``cacheable`` in a Gemini context cache, reused for
+                ``context_cache_ttl`` seconds (default: 3600) by requests
+                with the same prefix. Requests with tools are not cached.
+                ``http2`` enables HTTP/2, so concurrent requests share one
+                connection (requires the ``h2`` package, installed with
+                ``pip install "univllm[http2]"``).
         """
         api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise AuthenticationError("Gemini API key is required")
 
         super().__init__(api_key=api_key, **kwargs)
-        self.client = genai.Client(api_key=api_key)
+        http2 = bool(self.config.get("http2", False))
+        self._http_limits = self.config.get("http_limits") or (
+            self.DEFAULT_HTTP2_LIMITS if http2 else self.DEFAULT_HTTP_LIMITS
+        )
+        self._cache_key = (api_key, http2, tuple(sorted(self._http_limits.items())))
+        # Pooled connections are bound to the event loop they were opened on,
+        # so clients are only shared between instances created on one loop
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        self._clients = self._client_cache.setdefault(loop, {}) if loop else {}
+        shared = self._clients.get(self._cache_key)
+        if shared is None:
+            shared = self._clients[self._cache_key] = self._create_client(http2)
+        shared.users += 1
+        self._shared: Optional[_SharedClient] = shared
+        # The SDK does not close an injected HTTP client, so keep a reference
+        self.client, self._http_client = shared.client, shared.http_client
+        self.cache: Optional[CacheBackend] = self.config.get("cache")
+        self.cache_ttl: Optional[float] = self.config.get("cache_ttl")
+        self.semantic_cache: Optional[SemanticCache] = self.config.get("semantic_cache")
+        self.semantic_cache_threshold: float = self.config.get(
+            "semantic_cache_threshold", 0.92
+        )
+        self.embedding_model: str = self.config.get(
+            "embedding_model", "text-embedding-004"
+        )
+        self.batch_threshold: Optional[int] = self.config.get("batch_threshold")
+        self.batch_timeout: float = self.config.get("batch_timeout", 48 * 3600)
+        self.stream_flush_chars: int = self.config.get("stream_flush_chars", 64)
+        self.stream_flush_ms: float = self.config.get("stream_flush_ms", 10.0)
+        self.max_concurrent_requests: Optional[int] = self.config.get(
+            "max_concurrent_requests"
+        )
+        self.max_retries: int = self.config.get("max_retries", 2)
+        qpm = self.config.get("qpm")
+        self._rate_limiter = _TokenBucket(qpm) if qpm else None
+        # Created on first use so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.context_cache: bool = self.config.get("context_cache", False)
+        self.context_cache_ttl: int = self.config.get("context_cache_ttl", 3600)
+        # Prefix hash -> (task creating the cache, renew time). The task's
+        # result is the cache name, or None if caching failed
+        self._context_caches: Dict[str, Tuple[asyncio.Task, float]] = {}
 
     @property
     def provider_type(self) -> ProviderType:
         """Return the provider type."""
         return ProviderType.GEMINI
 
-    def _prepare_messages_and_config(
+    async def prewarm(self) -> None:
+        """Open pooled connections by listing the available models.
+
+        Several requests run at once so that more than one keep-alive
+        connection is ready (up to 4, bounded by the pool size).
+        """
+        keepalive = self._http_limits.get("max_keepalive_connections")
+        connections = 4 if keepalive is None else min(keepalive, 4)
+        await asyncio.gather(
+            *(self.client.aio.models.list() for _ in range(connections))
+        )
+
+    def _create_client(self, http2: bool) -> "_SharedClient":
+        """Create the SDK client and the pooled HTTP client it sends through."""
+        try:
+            http_client = self._build_http_client(http2=http2)
+            if http_client is None:
+                http_client = httpx.AsyncClient(
+                    limits=httpx.Limits(**self._http_limits), http2=http2
+                )
+        except ImportError as e:
+            raise ConfigurationError(
+                "HTTP/2 requires the h2 package; install it with "
+                f'pip install "univllm[http2]" ({e})'
+            )
+        # The SDK passes its own per-request timeout (in milliseconds), which
+        # overrides the timeout of the injected HTTP client
+        timeout = self._http_limits.get("timeout")
+        client = genai.Client(
+            api_key=self.api_key,
+            http_options=types.HttpOptions(
+                httpx_async_client=http_client,
+                timeout=int(timeout * 1000) if timeout is not None else None,
+            ),
+        )
+        return _SharedClient(client, http_client)
+
+    async def close(self) -> None:
+        """Release the shared client.
+
+        The client is closed and dropped from the cache once every instance
+        using it has been closed; later instances then get a fresh pool.
+        """
+        shared, self._shared = self._shared, None
+        if shared is None:
+            return
+        shared.users -= 1
+        if shared.users:
+            return
+        if self._clients.get(self._cache_key) is shared:
+            del self._clients[self._cache_key]
+        await shared.client.aio.aclose()
+        await shared.http_client.aclose()
+
+    async def _embed_prompt(
         self, request: CompletionRequest
-    ) -> Tuple[List[Dict], types.GenerateContentConfig]:
-        """Prepare messages and configuration for Gemini API.
+    ) -> Tuple[Optional[List[float]], str]:
+        """Embed the user prompt for a semantic cache lookup.
 
         Args:
             request: Completion request
 
         Returns:
-            Tuple of (messages_content, config)
+            Tuple of (embedding, namespace). The namespace identifies the rest
+            of the request, so prompts only match within the same model, tools
+            and earlier conversation. The embedding is None if the request
+            does not end with a user message (e.g. it carries tool results)
+            or the embedding call fails.
         """
-        # Separate system messages from other messages
-        system_instruction = None
-        messages_content = []
+        if not request.messages or request.messages[-1].role != MessageRole.USER:
+            return None, ""
+
+        context = request.model_copy(
+            update={"messages": request.messages[:-1], "temperature": None}
+        )
+        namespace = make_cache_key(context)
+        try:
+            result = await self.client.aio.models.embed_content(
+                model=self.embedding_model,
+                contents=request.messages[-1].content,
+            )
+            return list(result.embeddings[0].values), namespace
+        except Exception:
+            # The cache is an optimisation; fall through to the normal request
+            return None, namespace
+
+    def _build_contents(
+        self, request: CompletionRequest
+    ) -> Tuple[Optional[str], List[types.Content]]:
+        """Convert the request messages to Gemini contents.
+
+        Args:
+            request: Completion request
+
+        Returns:
+            Tuple of (system_instruction, messages_content)
+        """
+        system_instruction, messages_content, _ = self._build_contents_and_prefix(
+            request
+        )
+        return system_instruction, messages_content
 
-        for msg in request.messages:
+    def _build_contents_and_prefix(
+        self, request: CompletionRequest
+    ) -> Tuple[Optional[str], List[types.Content], int]:
+        """Convert the request messages to Gemini contents.
+
+        Args:
+            request: Completion request
+
+        Returns:
+            Tuple of (system_instruction, messages_content, prefix_length),
+            where the first ``prefix_length`` contents hold exactly the
+            messages marked ``cacheable``
+        """
+        # Use the last system message as system_instruction
+        system_instruction = next(
+            (
+                msg.content
+                for msg in reversed(request.messages)
+                if msg.role == MessageRole.SYSTEM
+            ),
+            None,
+        )
+
+        messages = request.messages
+        if any(msg.cacheable for msg in messages):
+            # Static messages go first, so requests sharing them also share a
+            # prefix that Gemini can cache; order within each group is kept
+            messages = [msg for msg in messages if msg.cacheable] + [
+                msg for msg in messages if not msg.cacheable
+            ]
+
+        # Gemini matches function responses by name, so remember the names of
+        # the calls requested earlier in the conversation
+        tool_call_names: Dict[str, str] = {}
+        messages_content: List[types.Content] = []
+        prefix_length = 0
+        previous = None
+        for msg in messages:
             if msg.role == MessageRole.SYSTEM:
-                # Use the last system message as system_instruction
-                system_instruction = msg.content
+                continue
+            content = self._to_content(msg, tool_call_names)
+            if (
+                msg.role == MessageRole.TOOL
+                and previous is not None
+                and previous.role == MessageRole.TOOL
+                and previous.cacheable == msg.cacheable
+            ):
+                # Responses to parallel function calls must share one content,
+                # unless that would carry the cacheable prefix into the rest
+                messages_content[-1].parts.extend(content.parts)
             else:
-                # Convert 'assistant' to 'model' for Gemini API
-                role = "model" if msg.role == MessageRole.ASSISTANT else msg.role.value
-                messages_content.append({"role": role, "parts": [{"text": msg.content}]})
-
-        # Configure generation parameters
-        config = types.GenerateContentConfig()
-        if system_instruction:
-            config.system_instruction = system_instruction
-        if request.max_tokens is not None:
-            config.max_output_tokens = request.max_tokens
-        if request.temperature is not None:
-            config.temperature = request.temperature
-        if request.top_p is not None:
-            config.top_p = request.top_p
-
-        # Add tools if provided (convert MCP format to Gemini format)
-        if request.tools:
-            function_declarations = []
-            for tool in request.tools:
-                # Convert MCP tool definition to Gemini function declaration
-                func_decl = {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.input_schema,
-                }
-                function_declarations.append(func_decl)
-            
-            # Create Tool object with function declarations
-            gemini_tool = types.Tool(function_declarations=function_declarations)
-            config.tools = [gemini_tool]
-            
-            # Handle tool_choice if specified
-            if request.tool_choice:
-                # Gemini uses different format for tool choice
-                if request.tool_choice == "auto":
-                    config.tool_config = types.ToolConfig(
-                        function_calling_config=types.FunctionCallingConfig(
-                            mode="AUTO"
-                        )
-                    )
-                elif request.tool_choice == "none":
-                    config.tool_config = types.ToolConfig(
-                        function_calling_config=types.FunctionCallingConfig(
-                            mode="NONE"
-                        )
-                    )
-                else:
-                    # Specific tool name - use ANY mode and filter with allowed_function_names
-                    config.tool_config = types.ToolConfig(
-                        function_calling_config=types.FunctionCallingConfig(
-                            mode="ANY",
-                            allowed_function_names=[request.tool_choice]
-                        )
+                messages_content.append(content)
+            if msg.cacheable:
+                prefix_length = len(messages_content)
+            previous = msg
+
+        return system_instruction, messages_content, prefix_length
+
+    @staticmethod
+    def _to_content(msg: Message, tool_call_names: Dict[str, str]) -> types.Content:
+        """Convert a non-system message to Gemini content.
+
+        Args:
+            msg: Message to convert
+            tool_call_names: Names of the tool calls seen so far by id; calls in
+                ``msg`` are added to it
+
+        Returns:
+            Content for the Gemini API
+        """
+        role_value = msg.role.value
+        if role_value == "tool":
+            function_response = types.FunctionResponse(
+                id=msg.tool_call_id,
+                name=msg.name or tool_call_names.get(msg.tool_call_id),
+                response={"result": msg.content},
+            )
+            return types.Content(
+                role="user",
+                parts=[types.Part(function_response=function_response)],
+            )
+
+        parts = []
+        if msg.content or not msg.tool_calls:
+            parts.append(types.Part(text=msg.content))
+        for tool_call in msg.tool_calls or []:
+            if tool_call.id:
+                tool_call_names[tool_call.id] = tool_call.name
+            parts.append(
+                types.Part(
+                    function_call=types.FunctionCall(
+                        id=tool_call.id,
+                        name=tool_call.name,
+                        args=tool_call.arguments,
                     )
+                )
+            )
+        role = _GEMINI_ROLES.get(role_value, role_value)
+        return types.Content(role=role, parts=parts)
+
+    def _build_config(
+        self, request: CompletionRequest, system_instruction: Optional[str]
+    ) -> types.GenerateContentConfig:
+        """Build the generation config for a request.
+
+        Args:
+            request: Completion request
+            system_instruction: System instruction from ``_build_contents``
+
+        Returns:
+            GenerateContentConfig for the API call. It may be shared with other
+            requests, so callers must not modify it.
+        """
+        config = _base_config(
+            system_instruction, request.max_tokens, request.temperature, request.top_p
+        )
+        if not request.tools:
+            return config
+
+        # Add tools (converting MCP format to Gemini format) on a copy so the
+        # cached config is left untouched
+        function_declarations = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": tool.input_schema,
+            }
+            for tool in request.tools
+        ]
+        update = {"tools": [types.Tool(function_declarations=function_declarations)]}
+
+        # Handle tool_choice if specified; Gemini uses a different format
+        if request.tool_choice == "auto":
+            calling_config = types.FunctionCallingConfig(mode="AUTO")
+        elif request.tool_choice == "none":
+            calling_config = types.FunctionCallingConfig(mode="NONE")
+        elif request.tool_choice:
+            # Specific tool name - use ANY mode and filter with allowed_function_names
+            calling_config = types.FunctionCallingConfig(
+                mode="ANY", allowed_function_names=[request.tool_choice]
+            )
+        else:
+            calling_config = None
+        if calling_config:
+            update["tool_config"] = types.ToolConfig(
+                function_calling_config=calling_config
+            )
 
-        return messages_content, config
+        return config.model_copy(update=update)
+
+    async def _prepare_request(
+        self, request: CompletionRequest
+    ) -> Tuple[List[types.Content], types.GenerateContentConfig]:
+        """Prepare messages and configuration, using a context cache if enabled.
+
+        Args:
+            request: Completion request
+
+        Returns:
+            Tuple of (messages_content, config)
+        """
+        system_instruction, messages_content, prefix_length = (
+            self._build_contents_and_prefix(request)
+        )
+        config = self._build_config(request, system_instruction)
+        if not self.context_cache or request.tools:
+            return messages_content, config
+
+        # Keep at least one content to send with the request
+        prefix_length = min(prefix_length, len(messages_content) - 1)
+        if prefix_length <= 0:
+            return messages_content, config
+
+        cache_name = await self._get_context_cache(
+            request.model, system_instruction, messages_content[:prefix_length]
+        )
+        if cache_name is None:
+            return messages_content, config
+
+        # The system instruction is part of the cached content
+        config = config.model_copy(
+            update={"cached_content": cache_name, "system_instruction": None}
+        )
+        return messages_content[prefix_length:], config
+
+    async def _get_context_cache(
+        self,
+        model: str,
+        system_instruction: Optional[str],
+        prefix: List[types.Content],
+    ) -> Optional[str]:
+        """Return the name of a context cache holding the given prefix.
+
+        Args:
+            model: Model the cache is created for
+            system_instruction: System instruction to cache with the prefix
+            prefix: Leading messages to cache
+
+        Returns:
+            The cache name, or None if the prefix could not be cached
+        """
+        contents = [
+            content.model_dump(mode="json", exclude_none=True) for content in prefix
+        ]
+        key = hashlib.sha256(
+            json.dumps([model, system_instruction, contents], sort_keys=True).encode()
+        ).hexdigest()
+        now = time.monotonic()
+        entry = self._context_caches.get(key)
+        if entry is None or entry[1] <= now:
+            if len(self._context_caches) >= 256:
+                self._context_caches.pop(next(iter(self._context_caches)))
+            # Concurrent requests with the same prefix share one create call;
+            # renew shortly before the cache expires on the server
+            task = asyncio.ensure_future(
+                self._create_context_cache(model, system_instruction, prefix)
+            )
+            entry = (task, now + self.context_cache_ttl * 0.9)
+            self._context_caches[key] = entry
+
+        try:
+            # Shielded so a cancelled request doesn't cancel it for the others
+            return await asyncio.shield(entry[0])
+        except Exception:
+            # The cache is an optimisation: send this request uncached and
+            # let the next one try again
+            if self._context_caches.get(key) is entry:
+                del self._context_caches[key]
+            return None
+
+    async def _create_context_cache(
+        self,
+        model: str,
+        system_instruction: Optional[str],
+        prefix: List[types.Content],
+    ) -> Optional[str]:
+        """Create a context cache and return its name, or None if refused."""
+        try:
+            cached_content = await self.client.aio.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    contents=prefix,
+                    system_instruction=system_instruction,
+                    ttl=f"{self.context_cache_ttl}s",
+                ),
+            )
+        except errors.APIError:
+            # Usually the prefix is below the model's minimum cache size;
+            # remember that so every request doesn't try again
+            return None
+        return cached_content.name
 
     def get_model_capabilities(self, model: str) -> ModelCapabilities:
         """Get capabilities for a specific Gemini model."""
@@ -126,42 +709,117 @@ class GeminiProvider(BaseLLMProvider):
                 f"Model {model} is not supported by Gemini provider"
             )
 
-        # Default capabilities for Gemini models
-        capabilities = ModelCapabilities(
-            supports_system_messages=True,
-            supports_function_calling=True,
-            supports_streaming=True,
-            supports_vision=False,
+        # Callers may modify the result, so don't hand out the shared instance
+        return _lookup_capabilities(model).model_copy()
+
+    def _parse_response(
+        self, response: types.GenerateContentResponse, request: CompletionRequest
+    ) -> CompletionResponse:
+        """Convert a Gemini response into a CompletionResponse.
+
+        Args:
+            response: Response returned by generate_content
+            request: Request the response answers
+
+        Returns:
+            CompletionResponse object
+        """
+        content = ""
+        tool_calls = None
+        finish_reason = None
+
+        candidates = getattr(response, "candidates", None)
+        if candidates:
+            candidate = candidates[0]
+            text_parts = []
+            function_calls = []
+            parts = getattr(getattr(candidate, "content", None), "parts", None)
+            for part in parts or []:
+                text = getattr(part, "text", None)
+                if text:
+                    text_parts.append(str(text))  # Ensure it's a string
+                else:
+                    function_call = getattr(part, "function_call", None)
+                    if function_call is not None:
+                        function_calls.append(function_call)
+            content = " ".join(text_parts)
+
+            # Process function calls (tool calls)
+            if function_calls:
+                tool_calls = [
+                    ToolCall(
+                        id=getattr(fc, "id", None),
+                        name=fc.name,
+                        # fc.args is a dict-like object, or None without arguments
+                        arguments=dict(fc.args) if fc.args else {},
+                    )
+                    for fc in function_calls
+                ]
+
+            if getattr(candidate, "finish_reason", None) is not None:
+                finish_reason = str(candidate.finish_reason)
+        else:
+            # Fallback to simple text extraction
+            content = getattr(response, "text", None) or ""
+
+        # Token counts are None when the API omits them
+        meta = getattr(response, "usage_metadata", None)
+        usage = (
+            {
+                "prompt_tokens": meta.prompt_token_count or 0,
+                "completion_tokens": meta.candidates_token_count or 0,
+                "total_tokens": meta.total_token_count or 0,
+            }
+            if meta
+            else None
         )
 
-        # Model-specific capabilities based on latest Gemini specifications
-        if model.startswith("gemini-2.5-pro"):
-            # Gemini 2.5 Pro - advanced reasoning
-            capabilities.context_window = 1000000
-            capabilities.max_tokens = 8192
-            capabilities.supports_vision = True
-        elif model.startswith("gemini-2.5-flash"):
-            # Gemini 2.5 Flash - price-performance
-            capabilities.context_window = 1000000
-            capabilities.max_tokens = 8192
-            capabilities.supports_vision = True
-        elif model.startswith("gemini-2.0-flash"):
-            # Gemini 2.0 Flash
-            capabilities.context_window = 1000000
-            capabilities.max_tokens = 8192
-            capabilities.supports_vision = True
-        elif model.startswith("gemini-1.5-pro"):
-            # Gemini 1.5 Pro
-            capabilities.context_window = 2000000
-            capabilities.max_tokens = 8192
-            capabilities.supports_vision = True
-        elif model.startswith("gemini-1.5-flash"):
-            # Gemini 1.5 Flash
-            capabilities.context_window = 1000000
-            capabilities.max_tokens = 8192
-            capabilities.supports_vision = True
-
-        return capabilities
+        return CompletionResponse(
+            content=content,
+            model=request.model,
+            usage=usage,
+            finish_reason=finish_reason,
+            provider=self.provider_type,
+            tool_calls=tool_calls,
+        )
+
+    def _map_error(self, e: Exception) -> Exception:
+        """Map an SDK exception to the matching univllm exception."""
+        if isinstance(e, errors.APIError):
+            if _is_auth_error(e):
+                return AuthenticationError(f"Gemini authentication failed: {e}")
+            if _is_rate_limit_error(e):
+                return ProviderError(f"Gemini rate limit exceeded: {e}")
+        return ProviderError(f"Gemini provider error: {e}")
+
+    async def _generate_content(self, **kwargs) -> types.GenerateContentResponse:
+        """Call generate_content within the concurrency and rate limits.
+
+        Rate-limited calls are retried with exponential backoff and jitter.
+        """
+        if self.max_concurrent_requests and self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        attempt = 0
+        while True:
+            try:
+                if self._semaphore is None:
+                    return await self._send_generate_content(**kwargs)
+                async with self._semaphore:
+                    return await self._send_generate_content(**kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_rate_limit_error(e):
+                    raise
+
+            # Back off outside the semaphore so other requests can proceed
+            delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2**attempt)
+            attempt += 1
+            await asyncio.sleep(delay + random.uniform(0, delay / 2))
+
+    async def _send_generate_content(self, **kwargs) -> types.GenerateContentResponse:
+        if self._rate_limiter:
+            await self._rate_limiter.acquire()
+        return await self.client.aio.models.generate_content(**kwargs)
 
     async def complete(self, request: CompletionRequest) -> CompletionResponse:
         """Generate a completion using Gemini."""
@@ -170,96 +828,128 @@ class GeminiProvider(BaseLLMProvider):
                 f"Model {request.model} is not supported by Gemini provider"
             )
 
+        # Deterministic requests are answered from the cache when possible
+        cache_key = make_cache_key(request) if self.cache else None
+        if cache_key:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return CompletionResponse(**cached)
+
+        # Near-duplicate prompts are answered from the semantic cache, but only
+        # for low temperatures where a reused answer is acceptable
+        embedding = None
+        if self.semantic_cache and (request.temperature or 0) <= 0.3:
+            embedding, namespace = await self._embed_prompt(request)
+            if embedding:
+                hit = await self.semantic_cache.query(
+                    embedding, self.semantic_cache_threshold, namespace
+                )
+                if hit is not None:
+                    usage = {**(hit.usage or {}), "cache_hit": 1}
+                    return hit.model_copy(update={"usage": usage})
+
         try:
             # Prepare messages and configuration
-            messages_content, config = self._prepare_messages_and_config(request)
+            messages_content, config = await self._prepare_request(request)
 
             # Make the API call using async interface
-            response = await self.client.aio.models.generate_content(
+            response = await self._generate_content(
                 model=request.model,
                 contents=messages_content,
                 config=config,
             )
 
-            # Extract the response content
-            content = ""
-            tool_calls = None
-            
-            # Check if response has candidates
-            if hasattr(response, "candidates") and response.candidates:
-                candidate = response.candidates[0]
-                
-                # Extract content from parts
-                if hasattr(candidate, "content") and hasattr(candidate.content, "parts"):
-                    text_parts = []
-                    function_call_parts = []
-                    
-                    for part in candidate.content.parts:
-                        # Check for text content
-                        if hasattr(part, "text") and part.text:
-                            text_parts.append(str(part.text))  # Ensure it's a string
-                        # Check for function call
-                        elif hasattr(part, "function_call"):
-                            function_call_parts.append(part.function_call)
-                    
-                    content = " ".join(text_parts) if text_parts else ""
-                    
-                    # Process function calls (tool calls)
-                    if function_call_parts:
-                        tool_calls = []
-                        for fc in function_call_parts:
-                            # Extract arguments from function call
-                            args = {}
-                            if hasattr(fc, "args") and fc.args:
-                                # fc.args is typically a dict-like object
-                                args = dict(fc.args) if hasattr(fc.args, "__iter__") else {}
-                            
-                            tool_calls.append(
-                                ToolCall(
-                                    id=getattr(fc, "id", None),
-                                    name=fc.name,
-                                    arguments=args
-                                )
-                            )
-            else:
-                # Fallback to simple text extraction
-                content = response.text if hasattr(response, "text") else ""
-
-            # Extract usage information if available
-            usage = None
-            if hasattr(response, "usage_metadata"):
-                usage_metadata = response.usage_metadata
-                usage = {
-                    "prompt_tokens": getattr(usage_metadata, "prompt_token_count", 0),
-                    "completion_tokens": getattr(
-                        usage_metadata, "candidates_token_count", 0
-                    ),
-                    "total_tokens": getattr(usage_metadata, "total_token_count", 0),
-                }
-
-            finish_reason = None
-            if hasattr(response, "candidates") and response.candidates:
-                candidate = response.candidates[0]
-                if hasattr(candidate, "finish_reason"):
-                    finish_reason = str(candidate.finish_reason)
-
-            return CompletionResponse(
-                content=content,
-                model=request.model,
-                usage=usage,
-                finish_reason=finish_reason,
-                provider=self.provider_type,
-                tool_calls=tool_calls,
+            completion = self._parse_response(response, request)
+            if cache_key:
+                await self.cache.set(cache_key, completion.model_dump(), self.cache_ttl)
+            if embedding:
+                await self.semantic_cache.add(embedding, completion, namespace)
+            return completion
+
+        except Exception as e:
+            raise self._map_error(e)
+
+    async def complete_batch(
+        self, requests: List[CompletionRequest]
+    ) -> List[CompletionResponse]:
+        """Generate completions for several requests.
+
+        Batches of at least ``batch_threshold`` requests for the same model go
+        through the Gemini Batch API, which is cheaper but may take a long time
+        to finish. Smaller batches run concurrently instead.
+
+        Args:
+            requests: Completion requests
+
+        Returns:
+            Completion responses, in the same order as ``requests``
+        """
+        models = {request.model for request in requests}
+        if (
+            self.batch_threshold is None
+            or len(requests) < self.batch_threshold
+            or len(models) != 1
+        ):
+            return await super().complete_batch(requests)
+
+        model = models.pop()
+        if not self.validate_model(model):
+            raise ModelNotSupportedError(
+                f"Model {model} is not supported by Gemini provider"
             )
 
+        try:
+            inlined_requests = []
+            for request in requests:
+                system_instruction, contents = self._build_contents(request)
+                inlined_requests.append(
+                    types.InlinedRequest(
+                        contents=contents,
+                        config=self._build_config(request, system_instruction),
+                    )
+                )
+
+            job = await self.client.aio.batches.create(
+                model=model, src=inlined_requests
+            )
+            # Poll with exponential backoff until the job finishes
+            deadline = time.monotonic() + self.batch_timeout
+            delay = 1.0
+            while job.state not in _BATCH_DONE_STATES:
+                if time.monotonic() >= deadline:
+                    raise ProviderError(
+                        f"Gemini batch job {job.name} did not finish within "
+                        f"{self.batch_timeout} seconds (state {job.state})"
+                    )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+                job = await self.client.aio.batches.get(name=job.name)
+        except ProviderError:
+            raise
         except Exception as e:
-            error_str = str(e).lower()
-            if "api key" in error_str or "auth" in error_str or "401" in error_str:
-                raise AuthenticationError(f"Gemini authentication failed: {e}")
-            elif "quota" in error_str or "rate" in error_str or "429" in error_str:
-                raise ProviderError(f"Gemini rate limit exceeded: {e}")
-            else:
-                raise ProviderError(f"Gemini provider error: {e}")
+            raise self._map_error(e)
+
+        if job.state not in _BATCH_SUCCESS_STATES:
+            raise ProviderError(
+                f"Gemini batch job {job.name} finished with state {job.state}: "
+                f"{job.error}"
+            )
+
+        inlined_responses = (job.dest and job.dest.inlined_responses) or []
+        if len(inlined_responses) != len(requests):
+            raise ProviderError(
+                f"Gemini batch job {job.name} returned {len(inlined_responses)} "
+                f"responses for {len(requests)} requests"
+            )
+
+        responses = []
+        for request, item in zip(requests, inlined_responses):
+            if item.error or item.response is None:
+                raise ProviderError(
+                    f"Gemini batch request failed: {item.error or 'no response'}"
+                )
+            responses.append(self._parse_response(item.response, request))
+        return responses
 
     async def stream_complete(self, request: CompletionRequest) -> AsyncIterator[str]:
         """Generate a streaming completion using Gemini."""
@@ -270,7 +960,7 @@ class GeminiProvider(BaseLLMProvider):
 
         try:
             # Prepare messages and configuration
-            messages_content, config = self._prepare_messages_and_config(request)
+            messages_content, config = await self._prepare_request(request)
 
             # Make the streaming API call using async interface
             response_stream = await self.client.aio.models.generate_content_stream(
@@ -279,15 +969,17 @@ class GeminiProvider(BaseLLMProvider):
                 config=config,
             )
 
-            async for chunk in response_stream:
-                if hasattr(chunk, "text") and chunk.text:
-                    yield chunk.text
+            async def texts() -> AsyncIterator[str]:
+                async for chunk in response_stream:
+                    if hasattr(chunk, "text") and chunk.text:
+                        yield chunk.text
+
+            # Models often emit many tiny chunks; merge them to cut per-chunk
+            # overhead for the consumer
+            async for text in _coalesce(
+                texts(), self.stream_flush_chars, self.stream_flush_ms
+            ):
+                yield text
 
         except Exception as e:
-            error_str = str(e).lower()
-            if "api key" in error_str or "auth" in error_str or "401" in error_str:
-                raise AuthenticationError(f"Gemini authentication failed: {e}")
-            elif "quota" in error_str or "rate" in error_str or "429" in error_str:
-                raise ProviderError(f"Gemini rate limit exceeded: {e}")
-            else:
-                raise ProviderError(f"Gemini provider error: {e}")
+            raise self._map_error(e)
@@ -38,13 +38,23 @@ class OpenAIProvider(BaseLLMProvider):
             raise AuthenticationError("OpenAI API key is required")
 
         super().__init__(api_key=api_key, **kwargs)
-        self.client = openai.AsyncOpenAI(api_key=api_key)
+        self.client = openai.AsyncOpenAI(
+            api_key=api_key, http_client=self._build_http_client()
+        )
 
     @property
     def provider_type(self) -> ProviderType:
         """Return the provider type."""
         return ProviderType.OPENAI
 
+    async def prewarm(self) -> None:
+        """Open a pooled connection by listing the available models."""
+        await self.client.models.list()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self.client.close()
+
     def get_model_capabilities(self, model: str) -> ModelCapabilities:
         """Get capabilities for a specific OpenAI model."""
         if not self.validate_model(model):